@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+ALERT LEDGER
+Remembers which picks have already gone out to Discord, keyed by (event, market, side, line
+bucket), so a rerun alerts only on new picks and on lines that moved far enough to matter
+Entries expire at kickoff: once a game has started there is nothing left to alert
+"""
+
+import json
+import math
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+
+LEDGER_PATH = 'data/alert_ledger.json'
+
+# Points per line bucket: a move inside a bucket is noise, crossing into the next is a new alert
+LINE_STEPS = {'spread': 1.0, 'total': 2.0}
+
+# Lifetime of an entry whose kickoff can't be read
+FALLBACK_TTL = timedelta(days=7)
+
+
+def line_bucket(market: str, line: Optional[float]) -> str:
+    """The bucket a line falls in, e.g. spread -3.5 -> '-4', total 47.5 -> '46'; '' for unbucketed markets"""
+    step = LINE_STEPS.get(market)
+    if step is None or line is None:
+        return ''
+    return f"{math.floor(float(line) / step) * step:g}"
+
+
+def alert_key(event: str, market: str, side: str, line: Optional[float] = None) -> str:
+    return '|'.join((str(event), market, str(side), line_bucket(market, line)))
+
+
+def kickoff_timestamp(commence_time: str) -> float:
+    """Epoch seconds of an odds-feed ISO kickoff, or FALLBACK_TTL from now when it won't parse"""
+    try:
+        return datetime.fromisoformat(str(commence_time).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return (datetime.now() + FALLBACK_TTL).timestamp()
+
+
+class AlertLedger:
+    def __init__(self, path: str = LEDGER_PATH):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str = LEDGER_PATH, now: Optional[float] = None) -> 'AlertLedger':
+        """The saved ledger with entries past kickoff dropped, or an empty one"""
+        ledger = cls(path)
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    ledger.entries = json.load(f)
+            except (OSError, ValueError):
+                ledger.entries = {}
+        ledger.expire(now)
+        return ledger
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, key: str, commence_time: str):
+        """Mark a key alerted until its game kicks off"""
+        self.entries[key] = {
+            'expires': kickoff_timestamp(commence_time),
+            'sent_at': datetime.now().isoformat(timespec='seconds')
+        }
+        self.dirty = True
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop entries whose game has kicked off"""
+        now = datetime.now().timestamp() if now is None else now
+        stale = [key for key, entry in self.entries.items() if entry.get('expires', 0) <= now]
+        for key in stale:
+            del self.entries[key]
+        self.dirty = self.dirty or bool(stale)
+        return len(stale)
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+        self.dirty = False
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+ANALYSIS CACHE
+Content-addressed store of generated game analysis, one file per week
+Key = hash of (event ID, lines, team stats, totals projection, engine version, seed),
+so a game whose inputs haven't moved reuses its previous pick and prose exactly
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import List, Dict, Any, Optional
+
+CACHE_DIR = 'data/analysis_cache'
+
+# Weeks of cache kept on disk, counting the current one
+KEEP_WEEKS = 2
+
+
+def engine_version(name: str, *parts: Any) -> str:
+    """Engine name plus a digest of the data the engine reads (phrase pools, margin tables)
+
+    Changing that data invalidates old entries on its own; changes to pick logic or to
+    wording written inside methods need the name bumped by hand.
+    """
+    digest = hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()[:12]
+    return f"{name}-{digest}"
+
+
+def event_id(game: Dict) -> str:
+    """The odds feed's event ID, or the matchup and kickoff when there isn't one"""
+    return game.get('event_id') or f"{game['away_team']}@{game['home_team']}:{game.get('commence_time', '')}"
+
+
+class AnalysisCache:
+    def __init__(self, prefix: str, week: int, cache_dir: str = CACHE_DIR):
+        self.prefix = prefix
+        self.week = week
+        self.cache_dir = cache_dir
+        self.entries = {}
+        self.hits = 0
+        self.dirty = False
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.cache_dir, f"{self.prefix}-week-{self.week}.json")
+
+    @classmethod
+    def load(cls, prefix: str, week: int, cache_dir: str = CACHE_DIR) -> 'AnalysisCache':
+        """This week's cache, or an empty one"""
+        cache = cls(prefix, week, cache_dir)
+        if os.path.exists(cache.path):
+            try:
+                with open(cache.path, 'r', encoding='utf-8') as f:
+                    cache.entries = json.load(f)
+            except (OSError, ValueError):
+                cache.entries = {}
+        return cache
+
+    def key(self, game: Dict, team_stats: List[Dict], totals_projection: Optional[Dict], version: str, seed: int) -> str:
+        """Content hash of everything that feeds a game's analysis"""
+        inputs = {
+            'event': event_id(game),
+            'game': game,
+            'teams': team_stats,
+            'totals': totals_projection,
+            'version': version,
+            'seed': seed,
+        }
+        payload = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        analysis = self.entries.get(key)
+        if analysis is not None:
+            self.hits += 1
+        return analysis
+
+    def put(self, key: str, analysis: Dict):
+        self.entries[key] = analysis
+        self.dirty = True
+
+    def save(self, live_keys: Optional[List[str]] = None):
+        """Write the week back, keeping only live_keys when given (games still on the slate)"""
+        if live_keys is not None:
+            live = set(live_keys)
+            stale = [key for key in self.entries if key not in live]
+            for key in stale:
+                del self.entries[key]
+            self.dirty = self.dirty or bool(stale)
+        if not self.dirty:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+    def evict_old_weeks(self, keep_weeks: int = KEEP_WEEKS) -> int:
+        """Delete this prefix's cache files outside the last keep_weeks weeks (including a past season's)"""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        pattern = re.compile(rf"^{re.escape(self.prefix)}-week-(\d+)\.json$")
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            match = pattern.match(name)
+            if match and not self.week - keep_weeks < int(match.group(1)) <= self.week:
+                os.remove(os.path.join(self.cache_dir, name))
+                removed += 1
+        return removed
@@ -9,7 +9,33 @@ import json
 import random
 from datetime import datetime, timedelta
 import os
-from typing import List, Dict, Any
+import subprocess
+from typing import List, Dict, Any, Iterator
+
+import totals_engine
+import margin_tables
+import parlay_optimizer
+import bet_builder
+import parallel_analysis
+from analysis_cache import AnalysisCache, engine_version
+from fragment_cache import FragmentCache
+import picks_feed
+import html_writer
+import site_css
+import icon_sprites
+import html_minify
+import site_archive
+import search_index
+import site_publish
+
+# Bump when pick logic or wording inside the write-up methods changes; phrase pools and margin tables are digested
+ANALYSIS_ENGINE_NAME = 'prisco-3'
+
+# Values the {placeholders} in template class names take, so the stylesheet covers every variant
+CSS_PLACEHOLDERS = {'color': ('yellow', 'blue')}
+
+# Game cards rendered with the page; the rest render in batches of this size as the reader scrolls
+CARD_BATCH_SIZE = 12
 
 class AutoPilotBettingUpdater:
     def __init__(self):
@@ -25,9 +51,37 @@ class AutoPilotBettingUpdater:
             'news_api': os.getenv('NEWS_API_KEY', 'your_news_key')
         }
         
+        # Season and week come from one calendar so archives, feeds and the page agree on both
+        self.current_season = self.get_current_season()
         self.current_week = self.get_current_week()
         self.bovada_focus = True
         
+        # Game analysis fans out across this many processes; the seed keeps the prose reproducible
+        self.analysis_workers = int(os.getenv('ANALYSIS_WORKERS', '1'))
+        self.analysis_seed = int(os.getenv('ANALYSIS_SEED', '0'))
+        
+        # Sign-offs for the bottom line
+        self.prisco_endings = [
+            "Take it and run.",
+            "Lock it in.",
+            "Easy money here.",
+            "This line won't last long.",
+            "The smart money is here.",
+            "I'm confident in this play."
+        ]
+        
+        # Rendered game cards and parlay blocks, reused while their inputs are unchanged
+        self.html_fragments = FragmentCache('prisco')
+        
+        # Per-league JSON feeds for picks.html; STATIC_HTML=0 publishes only the feeds
+        self.precompress_feeds = os.getenv('PICKS_GZIP', '0') == '1'
+        self.render_static_html = os.getenv('STATIC_HTML', '1') != '0'
+        
+        # PUBLISH_TARGET=local snapshots the site into versioned builds under PUBLISH_DIR instead of pushing to GitHub
+        self.publish_target = os.getenv('PUBLISH_TARGET', 'git')
+        self.publish_dir = os.getenv('PUBLISH_DIR', site_publish.LOCAL_ROOT)
+        self.stylesheet_href = None
+        
         # REAL NFL data based on current 2024 season
         self.nfl_team_data = {
             'Kansas City Chiefs': {
@@ -104,10 +158,19 @@ class AutoPilotBettingUpdater:
         
         print(f"AutoPilot initialized for Week {self.current_week}")
 
+    def get_current_season(self) -> int:
+        """NFL season the current date belongs to; January and February playoffs count toward the previous year's"""
+        now = datetime.now()
+        return now.year if now.month >= 3 else now.year - 1
+
+    def season_start(self, season: int) -> datetime:
+        """Kickoff of a season: the Thursday after Labor Day (the first Monday of September)"""
+        labor_day = datetime(season, 9, 1) + timedelta(days=(7 - datetime(season, 9, 1).weekday()) % 7)
+        return labor_day + timedelta(days=3)
+
     def get_current_week(self) -> int:
-        """Calculate current NFL week for 2025 season"""
-        # 2025 NFL season starts September 4, 2025
-        season_start = datetime(2025, 9, 4)
+        """Calculate current NFL week of the current season"""
+        season_start = self.season_start(self.current_season)
         now = datetime.now()
         
         # If we're before the season, we're in Week 1
@@ -188,6 +251,7 @@ class AutoPilotBettingUpdater:
             lines = self.extract_bovada_lines(game_data['bookmakers'], game_data)
             
             return {
+                'event_id': game_data.get('id'),
                 'away_team': away_team,
                 'home_team': home_team,
                 'commence_time': commence_time,
@@ -195,6 +259,10 @@ class AutoPilotBettingUpdater:
                 'total': lines['total'],
                 'away_ml': lines['away_ml'],
                 'home_ml': lines['home_ml'],
+                'away_spread_odds': lines['away_spread_odds'],
+                'home_spread_odds': lines['home_spread_odds'],
+                'over_odds': lines['over_odds'],
+                'under_odds': lines['under_odds'],
                 'league': league
             }
             
@@ -204,7 +272,9 @@ class AutoPilotBettingUpdater:
 
     def extract_bovada_lines(self, bookmakers: List[Dict], game_data: Dict) -> Dict:
         """Extract betting lines, prioritizing Bovada"""
-        lines = {'spread': 0, 'total': 45, 'away_ml': 100, 'home_ml': -120}
+        lines = {'spread': 0, 'total': 45, 'away_ml': 100, 'home_ml': -120,
+                 'away_spread_odds': -110, 'home_spread_odds': -110,
+                 'over_odds': -110, 'under_odds': -110}
         
         bovada_book = None
         for book in bookmakers:
@@ -217,24 +287,62 @@ class AutoPilotBettingUpdater:
         if target_book:
             for market in target_book['markets']:
                 if market['key'] == 'spreads':
-                    if market['outcomes'][0]['name'] == game_data['away_team']:
-                        lines['spread'] = market['outcomes'][1]['point']
-                    else:
-                        lines['spread'] = market['outcomes'][0]['point']
+                    for outcome in market['outcomes']:
+                        side = 'home' if outcome['name'] == game_data['home_team'] else 'away'
+                        lines[f'{side}_spread_odds'] = outcome.get('price', -110)
+                        if side == 'home':
+                            lines['spread'] = outcome['point']
                 elif market['key'] == 'totals':
                     lines['total'] = market['outcomes'][0]['point']
+                    for outcome in market['outcomes']:
+                        lines[f"{outcome['name'].lower()}_odds"] = outcome.get('price', -110)
                 elif market['key'] == 'h2h':
                     lines['away_ml'] = market['outcomes'][0]['price']
                     lines['home_ml'] = market['outcomes'][1]['price']
         
+        self.shop_spread_prices(bookmakers, game_data, lines)
+        
         return lines
 
-    def generate_game_analysis(self, game: Dict) -> Dict:
-        """Generate Pete Prisco style analysis"""
+    def shop_spread_prices(self, bookmakers: List[Dict], game_data: Dict, lines: Dict):
+        """Take the best price any book offers on our spread, side by side"""
+        home_point = lines['spread']
+        for book in bookmakers:
+            for market in book.get('markets', []):
+                if market['key'] != 'spreads':
+                    continue
+                for outcome in market['outcomes']:
+                    if 'price' not in outcome:
+                        continue
+                    if outcome['name'] == game_data['home_team'] and outcome['point'] == home_point:
+                        lines['home_spread_odds'] = max(lines['home_spread_odds'], outcome['price'])
+                    elif outcome['name'] == game_data['away_team'] and outcome['point'] == -home_point:
+                        lines['away_spread_odds'] = max(lines['away_spread_odds'], outcome['price'])
+
+    def get_team_data(self, team_name: str) -> Dict:
+        """Team data from our database, or defaults"""
+        return self.nfl_team_data.get(team_name, self.get_default_team_data(team_name))
+
+    def project_slate_totals(self, games: List[Dict]) -> List[Dict]:
+        """Run the totals engine over a whole slate in one batch"""
+        matchups = []
+        for game in games:
+            away_data = self.get_team_data(game['away_team'])
+            home_data = self.get_team_data(game['home_team'])
+            matchups.append({
+                'away_ppg': away_data['ppg'], 'away_allowed': away_data['opp_ppg'],
+                'home_ppg': home_data['ppg'], 'home_allowed': home_data['opp_ppg'],
+                'total': game['total'], 'league': game.get('league', 'NFL')
+            })
+        return totals_engine.project_slate_totals(matchups)
+
+    def generate_game_analysis(self, game: Dict, totals_projection: Dict = None, rng: random.Random = None) -> Dict:
+        """Generate Pete Prisco style analysis; rng is the game's own seeded stream (a fresh one when omitted)"""
+        rng = rng or random.Random()
         
         # Get team data
-        away_data = self.nfl_team_data.get(game['away_team'], self.get_default_team_data(game['away_team']))
-        home_data = self.nfl_team_data.get(game['home_team'], self.get_default_team_data(game['home_team']))
+        away_data = self.get_team_data(game['away_team'])
+        home_data = self.get_team_data(game['home_team'])
         
         # Calculate pick
         pick_data = self.calculate_smart_pick(game, away_data, home_data)
@@ -244,11 +352,11 @@ class AutoPilotBettingUpdater:
             'the_line': self.generate_prisco_line_analysis(game, away_data, home_data),
             'the_matchup': self.generate_prisco_matchup_analysis(game, away_data, home_data),
             'the_angle': self.generate_prisco_angle_analysis(game, away_data, home_data),
-            'the_bottom_line': self.generate_prisco_bottom_line(game, pick_data, away_data, home_data)
+            'the_bottom_line': self.generate_prisco_bottom_line(game, pick_data, away_data, home_data, rng)
         }
         
         # Generate realistic predicted score
-        predicted_score = self.generate_realistic_score(game, away_data, home_data)
+        predicted_score = self.generate_realistic_score(game, away_data, home_data, totals_projection)
         
         return {
             'game_info': {
@@ -259,7 +367,11 @@ class AutoPilotBettingUpdater:
                 'spread': game['spread'],
                 'total': game['total'],
                 'away_ml': game['away_ml'],
-                'home_ml': game['home_ml']
+                'home_ml': game['home_ml'],
+                'away_spread_odds': game.get('away_spread_odds', parlay_optimizer.DEFAULT_LEG_ODDS),
+                'home_spread_odds': game.get('home_spread_odds', parlay_optimizer.DEFAULT_LEG_ODDS),
+                'over_odds': game.get('over_odds', parlay_optimizer.DEFAULT_LEG_ODDS),
+                'under_odds': game.get('under_odds', parlay_optimizer.DEFAULT_LEG_ODDS)
             },
             'pick': pick_data,
             'predicted_score': predicted_score,
@@ -267,11 +379,34 @@ class AutoPilotBettingUpdater:
             'data_basis': {
                 'weeks_analyzed': self.current_week - 1,
                 'away_games': int(away_data['record'].split('-')[0]) + int(away_data['record'].split('-')[1]),
-                'home_games': int(home_data['record'].split('-')[0]) + int(home_data['record'].split('-')[1]),
-                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M')
+                'home_games': int(home_data['record'].split('-')[0]) + int(home_data['record'].split('-')[1])
             }
         }
 
+    def analyze_slate(self, games: List[Dict], totals: List[Dict]) -> List[Dict]:
+        """Analyses for a slate, reusing cached ones whose inputs haven't changed"""
+        cache = AnalysisCache.load('prisco', self.current_week)
+        # Rebuilt margin tables or edited sign-offs change every pick or write-up, so they key the cache too
+        version = engine_version(ANALYSIS_ENGINE_NAME, self.prisco_endings, margin_tables.load_tables().tables)
+        keys = [
+            cache.key(game, [self.get_team_data(game['away_team']), self.get_team_data(game['home_team'])], projection, version, self.analysis_seed)
+            for game, projection in zip(games, totals)
+        ]
+        analyses = [cache.get(key) for key in keys]
+        missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+        
+        fresh = parallel_analysis.analyze_games(
+            self, [games[i] for i in missing], [totals[i] for i in missing], self.analysis_workers, self.analysis_seed
+        )
+        for i, analysis in zip(missing, fresh):
+            cache.put(keys[i], analysis)
+            analyses[i] = analysis
+        
+        cache.save(keys)
+        cache.evict_old_weeks()
+        print(f"Reused {cache.hits} cached analyses, generated {len(missing)}")
+        return analyses
+
     def get_default_team_data(self, team_name: str) -> Dict:
         """Default data for teams not in our database"""
         return {
@@ -396,7 +531,7 @@ class AutoPilotBettingUpdater:
         
         return analysis or "Both teams have clear motivations entering this important matchup."
 
-    def generate_prisco_bottom_line(self, game: Dict, pick_data: Dict, away_data: Dict, home_data: Dict) -> str:
+    def generate_prisco_bottom_line(self, game: Dict, pick_data: Dict, away_data: Dict, home_data: Dict, rng: random.Random) -> str:
         """Generate Prisco-style final recommendation"""
         analysis = f"I'm taking {pick_data['team']} {pick_data['line']}. "
         
@@ -405,6 +540,13 @@ class AutoPilotBettingUpdater:
         if reasoning:
             analysis += reasoning + ". "
         
+        # Moneyline value from the same margin distribution
+        moneyline = pick_data.get('moneyline', {})
+        if moneyline.get('value_side'):
+            ml_side = moneyline['value_side']
+            ml_team = game[f'{ml_side}_team']
+            analysis += f"There's moneyline value on {ml_team} ({game[f'{ml_side}_ml']:+d}), who win {moneyline[f'{ml_side}_win_probability'] * 100:.0f}% of the time on our numbers. "
+        
         # Confidence level explanation
         confidence = pick_data['confidence']
         if confidence > 75:
@@ -415,16 +557,7 @@ class AutoPilotBettingUpdater:
             analysis += "It's a close call, but the numbers lean this way. "
         
         # Final Prisco touch
-        prisco_endings = [
-            "Take it and run.",
-            "Lock it in.",
-            "Easy money here.",
-            "This line won't last long.",
-            "The smart money is here.",
-            "I'm confident in this play."
-        ]
-        
-        analysis += random.choice(prisco_endings)
+        analysis += rng.choice(self.prisco_endings)
         
         return analysis
 
@@ -447,40 +580,62 @@ class AutoPilotBettingUpdater:
         # Expected margin with home field advantage
         expected_margin = home_diff - away_diff + 2.5
         actual_spread = game['spread']
+        league = game.get('league', 'NFL')
         
-        # Calculate value
-        value = abs(expected_margin - actual_spread)
+        # Distance between our number and the market's
+        value = abs(expected_margin + actual_spread)
+        
+        # Cover probabilities from the key-number margin tables
+        tables = margin_tables.load_tables()
+        cover = tables.cover_probability(league, actual_spread, expected_margin)
+        home_cover = cover['home'] / (cover['home'] + cover['away'])
         
         # Determine pick
-        if expected_margin > actual_spread + 2:
-            pick_team = game['home_team']
-            pick_line = f"{actual_spread}"
+        if home_cover >= 0.54:
+            pick_side = 'home'
             reasoning = f"Home team's superior form ({home_data['record']} vs {away_data['record']}) and point differential edge"
-        elif expected_margin < actual_spread - 2:
-            pick_team = game['away_team']
-            pick_line = f"+{abs(actual_spread)}"
+        elif home_cover <= 0.46:
+            pick_side = 'away'
             reasoning = f"Getting too many points with the better team ({away_data['record']} road record)"
+        elif home_cover > 0.5:
+            # Close call - the table still leans home
+            pick_side = 'home'
+            reasoning = f"Home field advantage and {home_data['recent_form']} recent form"
+        elif home_cover < 0.5:
+            # Close call - the table still leans to the points
+            pick_side = 'away'
+            reasoning = f"Road team momentum ({away_data['recent_form']}) and the points"
         else:
-            # Close call - go with recent form or home field
+            # Dead even on the table - only then let recent form break the tie
             if 'W' in away_data.get('recent_form', '') and away_win_pct > home_win_pct:
-                pick_team = game['away_team']
-                pick_line = f"+{abs(actual_spread)}"
+                pick_side = 'away'
                 reasoning = f"Road team momentum ({away_data['recent_form']}) and better record"
             else:
-                pick_team = game['home_team']
-                pick_line = f"{actual_spread}"
+                pick_side = 'home'
                 reasoning = f"Home field advantage and {home_data['recent_form']} recent form"
         
-        # Calculate confidence
-        base_confidence = 55
-        record_confidence = abs(away_win_pct - home_win_pct) * 20
-        value_confidence = min(value * 5, 15)
-        confidence = min(base_confidence + record_confidence + value_confidence, 85)
+        if pick_side == 'home':
+            pick_team = game['home_team']
+            pick_line = margin_tables.line_label(actual_spread)
+            cover_probability = home_cover
+        else:
+            pick_team = game['away_team']
+            pick_line = margin_tables.line_label(-actual_spread)
+            cover_probability = 1 - home_cover
+        
+        # Confidence follows the cover probability
+        confidence = margin_tables.confidence_from_probability(cover_probability, floor=50, cap=85)
         
         return {
             'team': pick_team,
             'line': pick_line,
+            'side': pick_side,
+            'odds': game.get(f'{pick_side}_spread_odds', parlay_optimizer.DEFAULT_LEG_ODDS),
             'confidence': round(confidence),
+            'cover_probability': round(cover_probability, 4),
+            'push_probability': round(cover['push'], 4),
+            'model_margin': round(expected_margin, 1),
+            'moneyline': tables.moneyline_value(league, expected_margin, game['away_ml'], game['home_ml']),
             'primary_reasoning': reasoning,
             'reasoning_data': {
                 'expected_margin': round(expected_margin, 1),
@@ -489,32 +644,21 @@ class AutoPilotBettingUpdater:
             }
         }
 
-    def generate_realistic_score(self, game: Dict, away_data: Dict, home_data: Dict) -> Dict:
-        """Generate realistic score prediction"""
-        away_avg = away_data['ppg']
-        home_avg = home_data['ppg']
-        
-        # Adjust for opponent defensive strength
-        away_projected = (away_avg + (45 - home_data['opp_ppg'])) / 2
-        home_projected = (home_avg + (45 - away_data['opp_ppg'])) / 2
-        
-        # Home field advantage
-        home_projected += 2
-        
-        # Add some realistic variance
-        away_score = max(10, round(away_projected + random.randint(-4, 4)))
-        home_score = max(10, round(home_projected + random.randint(-4, 4)))
-        
-        total_proj = away_score + home_score
+    def generate_realistic_score(self, game: Dict, away_data: Dict, home_data: Dict, projection: Dict = None) -> Dict:
+        """Predicted score as the most likely outcome of the totals engine's score distributions"""
+        if projection is None:
+            projection = self.project_slate_totals([game])[0]
         
         return {
             'away_team': game['away_team'],
-            'away_score': away_score,
+            'away_score': projection['away_score'],
             'home_team': game['home_team'],
-            'home_score': home_score,
-            'total_projected': total_proj,
+            'home_score': projection['home_score'],
+            'total_projected': projection['total_projected'],
             'game_total': game['total'],
-            'total_lean': 'OVER' if total_proj > game['total'] + 3 else 'UNDER' if total_proj < game['total'] - 3 else 'CLOSE'
+            'p_over': projection['p_over'],
+            'p_under': projection['p_under'],
+            'total_lean': projection['total_lean']
         }
 
     def is_divisional_game(self, team1: str, team2: str) -> bool:
@@ -536,56 +680,65 @@ class AutoPilotBettingUpdater:
         return False
 
     def generate_parlays(self, nfl_games: List[Dict], cfb_games: List[Dict]) -> Dict:
-        """Generate 3-game parlays for NFL and CFB"""
+        """Generate the best expected value parlays for NFL and CFB, with round robins and teasers"""
         nfl_parlay = self.build_parlay(nfl_games, 'NFL')
         cfb_parlay = self.build_parlay(cfb_games, 'CFB')
         
+        for parlay, games, league in ((nfl_parlay, nfl_games, 'NFL'), (cfb_parlay, cfb_games, 'CFB')):
+            parlay['round_robins'] = bet_builder.build_round_robins(games, league)
+            parlay['teasers'] = bet_builder.build_teasers(games, league)
+        
         return {
             'nfl': nfl_parlay,
             'cfb': cfb_parlay
         }
 
     def build_parlay(self, games: List[Dict], league: str) -> Dict:
-        """Build a 3-game parlay"""
-        if len(games) < 3:
-            return {'games': [], 'odds': 0, 'reasoning': f'Not enough {league} games available'}
+        """Build the 2-6 leg parlay with the highest expected value"""
+        best = parlay_optimizer.optimize_parlay(parlay_optimizer.build_legs(games, league), min_legs=2, max_legs=6)
+        if best is None:
+            return {'games': [], 'odds': 0, 'reasoning': f'No {league} ticket beats break-even on our numbers this week'}
         
-        top_games = sorted(games, key=lambda x: x['pick']['confidence'], reverse=True)[:3]
+        legs = best['legs']
         
-        individual_odds = [-110, -110, -110]
+        individual_odds = [leg['odds'] for leg in legs]
         parlay_odds = self.calculate_parlay_odds(individual_odds)
         
-        reasoning = f"Three confident {league} plays based on detailed matchup analysis. "
+        reasoning = f"{len(legs)} confident {league} plays based on detailed matchup analysis. "
         
-        for i, game in enumerate(top_games):
+        for i, leg in enumerate(legs):
             if i == 0:
-                reasoning += f"{game['pick']['team']} {game['pick']['line']} "
-            elif i == len(top_games) - 1:
-                reasoning += f"and {game['pick']['team']} {game['pick']['line']}. "
+                reasoning += f"{leg['label']} "
+            elif i == len(legs) - 1:
+                reasoning += f"and {leg['label']}. "
             else:
-                reasoning += f"{game['pick']['team']} {game['pick']['line']}, "
+                reasoning += f"{leg['label']}, "
         
-        reasoning += "These picks complement each other well with strong individual value."
+        if best['correlation_lift'] > 1.005:
+            reasoning += f"The same-game legs tend to hit together, lifting the ticket {(best['correlation_lift'] - 1) * 100:.0f}% over pricing them separately. "
+        elif best['correlation_lift'] < 0.995:
+            reasoning += f"The same-game legs work against each other a little, which costs the ticket {(1 - best['correlation_lift']) * 100:.0f}% of its hit rate. "
+        else:
+            reasoning += "Every leg comes from a different game, so each one stands on its own value. "
+        reasoning += f"Our numbers give this ticket a {best['probability'] * 100:.1f}% hit rate for {best['expected_value'] * 100:+.0f}% expected value."
         
         return {
             'games': [
                 {
-                    'matchup': f"{g['game_info']['away_team']} @ {g['game_info']['home_team']}",
-                    'pick': f"{g['pick']['team']} {g['pick']['line']}"
-                } for g in top_games
+                    'matchup': leg['game_id'],
+                    'pick': leg['label']
+                } for leg in legs
             ],
             'odds': parlay_odds,
+            'probability': round(best['probability'], 4),
+            'correlation_lift': round(best['correlation_lift'], 4),
+            'expected_value': round(best['expected_value'], 4),
             'reasoning': reasoning
         }
 
     def calculate_parlay_odds(self, individual_odds: List[int]) -> int:
         """Calculate parlay odds from individual game odds"""
-        decimal_odds = [self.american_to_decimal(odds) for odds in individual_odds]
-        parlay_decimal = 1
-        for odds in decimal_odds:
-            parlay_decimal *= odds
-        
-        return self.decimal_to_american(parlay_decimal)
+        return parlay_optimizer.price_parlays([individual_odds])['american_odds'][0]
 
     def american_to_decimal(self, american_odds: int) -> float:
         """Convert American odds to decimal"""
@@ -601,31 +754,44 @@ class AutoPilotBettingUpdater:
         else:
             return int(-100 / (decimal_odds - 1))
 
+    def publish_stylesheet(self) -> str:
+        """Build the purged stylesheet for this updater's templates once, and return its path"""
+        if self.stylesheet_href is None:
+            self.stylesheet_href = site_css.publish_stylesheet(
+                'prisco', [__file__, site_archive.__file__, search_index.__file__], CSS_PLACEHOLDERS
+            )
+        return self.stylesheet_href
+
     def update_html_site(self, nfl_games: List[Dict], cfb_games: List[Dict], parlays: Dict):
         """Update the HTML site with new picks"""
-        html_content = self.generate_html_content(nfl_games, cfb_games, parlays)
-        
-        with open('index.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        print("HTML site updated successfully!")
+        self.html_fragments = FragmentCache.load('prisco')
+        minify_stats = {}
+        sections = icon_sprites.inline_sprites(self.iter_html_content(nfl_games, cfb_games, parlays))
+        frozen = site_archive.freeze_previous_week('index.html', self.current_season, self.current_week)
+        if frozen:
+            print(f"Archived last week's page to {frozen}")
+        
+        size = html_writer.write_atomic('index.html', html_minify.minify_chunks(sections, minify_stats))
+        artifacts = html_minify.write_precompressed('index.html')
+        archived = site_archive.write_index(self.current_season, self.current_week, self.publish_stylesheet())
+        self.html_fragments.save()
+        
+        print(f"HTML site updated successfully! ({self.html_fragments.summary()}, archive lists {archived} past weeks)")
+        print(html_minify.describe('index.html', minify_stats, size, artifacts))
 
     def generate_html_content(self, nfl_games: List[Dict], cfb_games: List[Dict], parlays: Dict) -> str:
         """Generate complete HTML content"""
-        
-        nfl_parlay_html = self.generate_parlay_html(parlays['nfl'], 'NFL', 'yellow')
-        cfb_parlay_html = self.generate_parlay_html(parlays['cfb'], 'CFB', 'blue')
-        nfl_games_html = self.generate_games_html(nfl_games, 'NFL')
-        cfb_games_html = self.generate_games_html(cfb_games, 'CFB')
-        
-        html_content = f"""<!DOCTYPE html>
+        return ''.join(icon_sprites.inline_sprites(self.iter_html_content(nfl_games, cfb_games, parlays)))
+
+    def iter_html_content(self, nfl_games: List[Dict], cfb_games: List[Dict], parlays: Dict) -> Iterator[str]:
+        """Generate the page section by section, so it can be streamed to disk"""
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="picks-week" content="{self.current_season}-{self.current_week}">
     <title>Sharp Picks | NFL & CFB Analysis</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/lucide@latest/dist/umd/lucide.js"></script>
     <style>
         .glass-card {{ 
             background: linear-gradient(135deg, rgba(15, 23, 42, 0.9), rgba(30, 41, 59, 0.8));
@@ -638,6 +804,7 @@ class AutoPilotBettingUpdater:
             -webkit-text-fill-color: transparent;
         }}
     </style>
+    <link rel="stylesheet" href="{self.publish_stylesheet()}">
 </head>
 <body class="bg-gradient-to-br from-slate-900 via-slate-800 to-slate-900 text-white min-h-screen">
     <header class="glass-card border-b border-green-500/30 sticky top-0 z-50">
@@ -648,8 +815,9 @@ class AutoPilotBettingUpdater:
                     <p class="text-gray-400">Pete Prisco Style Analysis | Auto-Updated</p>
                 </div>
                 <div class="text-right">
-                    <p class="text-sm text-gray-400">Week <span class="text-green-400 font-bold">{self.current_week}</span> • Season 2025</p>
-                    <p class="text-xs text-green-400">Updated: {datetime.now().strftime("%A, %I:%M %p")}</p>
+                    <p class="text-sm text-gray-400">Week <span class="text-green-400 font-bold">{self.current_week}</span> • Season {self.current_season}</p>
+                    <p class="text-xs text-green-400" data-build-stamp>Updated: {datetime.now().strftime("%A, %I:%M %p")}</p>
+                    <a href="/archive/" class="text-xs text-gray-400 hover:text-white">Past weeks</a>
                 </div>
             </div>
         </div>
@@ -664,21 +832,75 @@ class AutoPilotBettingUpdater:
                 🎓 CFB
             </button>
         </div>
+{search_index.filter_bar()}
 
         <div id="nfl-content">
-            {nfl_parlay_html}
-            {nfl_games_html}
+            """
+        yield self.html_fragments.render(
+            'parlay', [parlays['nfl'], 'NFL', 'yellow'], self.generate_parlay_html, parlays['nfl'], 'NFL', 'yellow',
+            helpers=(self.generate_bet_builder_html,)
+        )
+        yield """
+            """
+        yield from self.iter_games_html(nfl_games, 'NFL')
+        yield """
         </div>
 
-        <div id="cfb-content" style="display: none;">
-            {cfb_parlay_html}
-            {cfb_games_html}
-        </div>
+        <div id="cfb-content" style="display: none;"><template data-lazy-league>
+            """
+        yield self.html_fragments.render(
+            'parlay', [parlays['cfb'], 'CFB', 'blue'], self.generate_parlay_html, parlays['cfb'], 'CFB', 'blue',
+            helpers=(self.generate_bet_builder_html,)
+        )
+        yield """
+            """
+        yield from self.iter_games_html(cfb_games, 'CFB')
+        yield f"""
+        </template></div>
     </div>
 
     <script>
+        // The inactive league renders on its first tab switch, and cards past the first
+        // batch render from their <template> as the reader scrolls toward them
+        function renderLeague(content) {{
+            const lazy = content.querySelector('template[data-lazy-league]');
+            if (lazy) {{
+                lazy.replaceWith(lazy.content);
+                document.dispatchEvent(new Event('cards-rendered'));
+            }}
+            if (content.dataset.paginated) return;
+            content.dataset.paginated = 'true';
+
+            const sentinel = content.querySelector('[data-card-sentinel]');
+            if (!sentinel) return;
+            const renderBatch = () => {{
+                const batch = content.querySelector('template[data-card-batch]');
+                if (!batch) return false;
+                batch.replaceWith(batch.content);
+                document.dispatchEvent(new Event('cards-rendered'));
+                return true;
+            }};
+            if (!('IntersectionObserver' in window)) {{
+                while (renderBatch()) {{}}
+                sentinel.remove();
+                return;
+            }}
+            const observer = new IntersectionObserver(entries => {{
+                if (!entries[0].isIntersecting) return;
+                if (renderBatch()) {{
+                    // Observe again so a sentinel still in range pulls in the next batch too
+                    observer.unobserve(sentinel);
+                    observer.observe(sentinel);
+                }} else {{
+                    observer.disconnect();
+                    sentinel.remove();
+                }}
+            }}, {{ rootMargin: '800px 0px' }});
+            observer.observe(sentinel);
+        }}
+
         document.addEventListener('DOMContentLoaded', function() {{
-            lucide.createIcons();
+            renderLeague(document.getElementById('nfl-content'));
         }});
 
         function switchLeague(league) {{
@@ -698,23 +920,26 @@ class AutoPilotBettingUpdater:
                 nflContent.style.display = 'none';
                 cfbContent.style.display = 'block';
             }}
+            renderLeague(league === 'nfl' ? nflContent : cfbContent);
         }}
     </script>
+    """
+        yield search_index.script_tag(search_index.build_index({'NFL': nfl_games, 'CFB': cfb_games}, CARD_BATCH_SIZE))
+        yield f"""
+    <script>{search_index.FILTER_SCRIPT}    </script>
 </body>
 </html>"""
-        
-        return html_content
 
     def generate_parlay_html(self, parlay: Dict, league: str, color: str) -> str:
         """Generate HTML for parlay section"""
         if not parlay['games']:
-            return f'<div class="glass-card rounded-xl p-6 mb-8"><p class="text-gray-400">No {league} parlay available this week</p></div>'
+            return f'<div class="glass-card rounded-xl p-6 mb-8"><p class="text-gray-400">No +EV {league} parlay this week</p>{self.generate_bet_builder_html(parlay, color)}</div>'
         
         games_html = ""
         for i, game in enumerate(parlay['games']):
             games_html += f"""
             <div class="p-4 bg-{color}-500/10 border border-{color}-500/30 rounded-lg">
-                <h4 class="font-bold text-{color}-400 mb-2">Game {i+1}</h4>
+                <h4 class="font-bold text-{color}-400 mb-2">Leg {i+1}</h4>
                 <p class="text-white font-medium">{game['matchup']}</p>
                 <p class="text-{color}-300 text-lg font-bold">{game['pick']}</p>
             </div>"""
@@ -723,9 +948,9 @@ class AutoPilotBettingUpdater:
         <div class="glass-card rounded-xl p-6 mb-8 border-2 border-{color}-500/40">
             <div class="flex items-center space-x-3 mb-6">
                 <div class="w-10 h-10 bg-{color}-500 rounded-lg flex items-center justify-center">
-                    <i data-lucide="layers" class="w-6 h-6 text-black"></i>
+                    <svg class="w-6 h-6 text-black" aria-hidden="true"><use href="#icon-layers"></use></svg>
                 </div>
-                <h2 class="text-2xl font-bold text-{color}-400">{league} 3-GAME PARLAY</h2>
+                <h2 class="text-2xl font-bold text-{color}-400">{league} {len(parlay['games'])}-LEG PARLAY</h2>
                 <div class="ml-auto text-right">
                     <p class="text-2xl font-bold text-{color}-400">{parlay['odds']:+d}</p>
                     <p class="text-sm text-gray-400">Expert Analysis</p>
@@ -740,68 +965,152 @@ class AutoPilotBettingUpdater:
                 <h3 class="font-bold text-green-400 mb-2">Parlay Reasoning:</h3>
                 <p class="text-gray-300">{parlay['reasoning']}</p>
             </div>
+            {self.generate_bet_builder_html(parlay, color)}
         </div>"""
 
+    def generate_bet_builder_html(self, parlay: Dict, color: str) -> str:
+        """Generate HTML for the round robin and teaser summaries under a parlay"""
+        rows = ""
+        for round_robin in parlay.get('round_robins', []):
+            rows += f"""
+                <tr class="border-t border-slate-700">
+                    <td class="py-2 text-{color}-300 font-bold">Round robin by {round_robin['size']}s</td>
+                    <td class="py-2 text-gray-300">{round_robin['tickets']} tickets from {len(round_robin['legs'])} legs</td>
+                    <td class="py-2 text-right text-green-400">{round_robin['expected_value'] * 100:+.1f}% EV</td>
+                </tr>"""
+        for teaser in parlay.get('teasers', []):
+            rows += f"""
+                <tr class="border-t border-slate-700">
+                    <td class="py-2 text-{color}-300 font-bold">{len(teaser['legs'])}-team teaser ({teaser['odds']:+d})</td>
+                    <td class="py-2 text-gray-300">{' / '.join(teaser['legs'])}</td>
+                    <td class="py-2 text-right text-green-400">{teaser['expected_value'] * 100:+.1f}% EV</td>
+                </tr>"""
+        
+        if not rows:
+            return ""
+        
+        return f"""
+            <div class="mt-4 p-4 bg-slate-800/50 rounded-lg">
+                <h3 class="font-bold text-green-400 mb-2">Round Robins &amp; Wong Teasers:</h3>
+                <table class="w-full text-sm">{rows}
+                </table>
+            </div>"""
+
+    def update_picks_json(self, nfl_games: List[Dict], cfb_games: List[Dict], parlays: Dict):
+        """Write per-league week feeds for picks.html, the data/weekly-picks.json index and the card search index"""
+        now = datetime.now()
+        games = []
+        for league, league_games in (('NFL', nfl_games), ('CFB', cfb_games)):
+            for game in league_games:
+                info, pick = game['game_info'], game['pick']
+                games.append({
+                    'league': league,
+                    'matchup': f"{info['away_team']} @ {info['home_team']}",
+                    'time': info['time'],
+                    'spread': info['spread'],
+                    'total': info['total'],
+                    'pick': f"{pick['team']} {pick['line']}",
+                    'odds': pick['odds'],
+                    'confidence': pick['confidence'],
+                    'cover_probability': pick['cover_probability']
+                })
+        
+        meta = {
+            'week': self.current_week,
+            'season': self.current_season,
+            'generated_at': now.strftime('%Y-%m-%dT%H:%M:%S'),
+            'last_updated': now.strftime('%B %d, %Y at %I:%M %p')
+        }
+        leagues = {
+            'NFL': picks_feed.league_feed('NFL', self.current_week, self.current_season, nfl_games, parlays['nfl']),
+            'CFB': picks_feed.league_feed('CFB', self.current_week, self.current_season, cfb_games, parlays['cfb'])
+        }
+        changed = picks_feed.write_week(meta, leagues, games, self.precompress_feeds)
+        feeds_changed = [path for path, rewritten in changed.items() if rewritten and path != picks_feed.INDEX_PATH]
+        search = search_index.build_index({'NFL': nfl_games, 'CFB': cfb_games}, CARD_BATCH_SIZE)
+        picks_feed.write_json(search_index.INDEX_PATH, search, self.precompress_feeds)
+        print(f"Picks feeds written ({len(feeds_changed)} of {len(leagues)} league feeds changed)")
+
     def generate_games_html(self, games: List[Dict], league: str) -> str:
         """Generate HTML for games section"""
-        games_html = f'<h2 class="text-2xl font-bold mb-6">{league} Week {self.current_week} Picks</h2>'
+        return ''.join(self.iter_games_html(games, league))
+
+    def iter_games_html(self, games: List[Dict], league: str) -> Iterator[str]:
+        """Yield the section heading, then the game cards
+
+        Cards past the first CARD_BATCH_SIZE go out in <template> batches that the page
+        renders as the reader scrolls toward them. Each card sits in a div carrying the id
+        the search index refers to it by.
+        """
+        yield f'<h2 class="text-2xl font-bold mb-6">{league} Week {self.current_week} Picks</h2>'
+        
+        for start in range(0, len(games), CARD_BATCH_SIZE):
+            if start:
+                yield f'<template data-card-batch="{start // CARD_BATCH_SIZE}">'
+            for position, game in enumerate(games[start:start + CARD_BATCH_SIZE], start):
+                yield f'<div id="card-{search_index.card_id(league, position)}">'
+                yield self.html_fragments.render('game_card', game, self.generate_game_card_html, game)
+                yield '</div>'
+            if start:
+                yield '</template>'
+        if len(games) > CARD_BATCH_SIZE:
+            yield '<div data-card-sentinel></div>'
+
+    def generate_game_card_html(self, game: Dict) -> str:
+        """Generate HTML for one game card"""
+        info = game['game_info']
+        pick = game['pick']
+        score = game['predicted_score']
+        analysis = game['analysis']
+        data_basis = game.get('data_basis', {})
         
-        for game in games:
-            info = game['game_info']
-            pick = game['pick']
-            score = game['predicted_score']
-            analysis = game['analysis']
-            data_basis = game.get('data_basis', {})
+        return f"""
+        <div class="glass-card rounded-xl p-6 mb-6">
+            <div class="flex items-center justify-between mb-4">
+                <div>
+                    <h3 class="text-xl font-bold">{info['away_team']} @ {info['home_team']}</h3>
+                    <p class="text-gray-400">{info['time']}</p>
+                    <p class="text-sm text-gray-500">{info['venue']}</p>
+                </div>
+                <div class="text-center">
+                    <p class="text-sm text-gray-400">Line</p>
+                    <p class="text-lg font-bold">{info['home_team'].split()[-1]} {info['spread']}</p>
+                    <p class="text-sm text-gray-400">O/U {info['total']}</p>
+                </div>
+            </div>
             
-            games_html += f"""
-            <div class="glass-card rounded-xl p-6 mb-6">
-                <div class="flex items-center justify-between mb-4">
-                    <div>
-                        <h3 class="text-xl font-bold">{info['away_team']} @ {info['home_team']}</h3>
-                        <p class="text-gray-400">{info['time']}</p>
-                        <p class="text-sm text-gray-500">{info['venue']}</p>
-                    </div>
-                    <div class="text-center">
-                        <p class="text-sm text-gray-400">Line</p>
-                        <p class="text-lg font-bold">{info['home_team'].split()[-1]} {info['spread']}</p>
-                        <p class="text-sm text-gray-400">O/U {info['total']}</p>
-                    </div>
+            <div class="p-4 bg-green-500/10 border border-green-500/30 rounded-lg mb-4">
+                <h4 class="font-bold text-green-400 text-lg mb-2">THE PICK: {pick['team'].split()[-1]} {pick['line']}</h4>
+                <p class="text-green-300 font-medium mb-2">Predicted Score: {score['away_team'].split()[-1]} {score['away_score']}, {score['home_team'].split()[-1]} {score['home_score']} | {score.get('total_lean', 'CLOSE')} {info['total']} ({score['p_over'] * 100:.0f}% over)</p>
+                <p class="text-sm text-gray-400">Confidence: {pick['confidence']}% | Based on {data_basis.get('weeks_analyzed', 0)} weeks analysis</p>
+            </div>
+            
+            <div class="space-y-4">
+                <div>
+                    <h4 class="font-bold text-blue-400 mb-2">The Line</h4>
+                    <p class="text-gray-300">{analysis['the_line']}</p>
                 </div>
                 
-                <div class="p-4 bg-green-500/10 border border-green-500/30 rounded-lg mb-4">
-                    <h4 class="font-bold text-green-400 text-lg mb-2">THE PICK: {pick['team'].split()[-1]} {pick['line']}</h4>
-                    <p class="text-green-300 font-medium mb-2">Predicted Score: {score['away_team'].split()[-1]} {score['away_score']}, {score['home_team'].split()[-1]} {score['home_score']} | {score.get('total_lean', 'CLOSE')}</p>
-                    <p class="text-sm text-gray-400">Confidence: {pick['confidence']}% | Based on {data_basis.get('weeks_analyzed', 0)} weeks analysis</p>
+                <div>
+                    <h4 class="font-bold text-blue-400 mb-2">The Matchup</h4>
+                    <p class="text-gray-300">{analysis['the_matchup']}</p>
                 </div>
                 
-                <div class="space-y-4">
-                    <div>
-                        <h4 class="font-bold text-blue-400 mb-2">The Line</h4>
-                        <p class="text-gray-300">{analysis['the_line']}</p>
-                    </div>
-                    
-                    <div>
-                        <h4 class="font-bold text-blue-400 mb-2">The Matchup</h4>
-                        <p class="text-gray-300">{analysis['the_matchup']}</p>
-                    </div>
-                    
-                    <div>
-                        <h4 class="font-bold text-blue-400 mb-2">The Angle</h4>
-                        <p class="text-gray-300">{analysis['the_angle']}</p>
-                    </div>
-                    
-                    <div>
-                        <h4 class="font-bold text-blue-400 mb-2">The Bottom Line</h4>
-                        <p class="text-gray-300">{analysis['the_bottom_line']}</p>
-                    </div>
+                <div>
+                    <h4 class="font-bold text-blue-400 mb-2">The Angle</h4>
+                    <p class="text-gray-300">{analysis['the_angle']}</p>
                 </div>
                 
-                <div class="mt-4 p-3 bg-slate-800/30 rounded text-xs text-gray-500">
-                    Team Records: {data_basis.get('away_games', 0)} games ({info['away_team'].split()[-1]}) vs {data_basis.get('home_games', 0)} games ({info['home_team'].split()[-1]}) | Updated: {data_basis.get('last_updated', 'N/A')}
+                <div>
+                    <h4 class="font-bold text-blue-400 mb-2">The Bottom Line</h4>
+                    <p class="text-gray-300">{analysis['the_bottom_line']}</p>
                 </div>
-            </div>"""
-        
-        return games_html
+            </div>
+            
+            <div class="mt-4 p-3 bg-slate-800/30 rounded text-xs text-gray-500">
+                Team Records: {data_basis.get('away_games', 0)} games ({info['away_team'].split()[-1]}) vs {data_basis.get('home_games', 0)} games ({info['home_team'].split()[-1]})
+            </div>
+        </div>"""
 
     def format_game_time(self, commence_time: str) -> str:
         """Format game time for display"""
@@ -840,6 +1149,8 @@ class AutoPilotBettingUpdater:
                 'total': 51.5,
                 'away_ml': 110,
                 'home_ml': -130,
+                'away_spread_odds': -105,
+                'home_spread_odds': -115,
                 'league': 'NFL'
             },
             {
@@ -850,6 +1161,8 @@ class AutoPilotBettingUpdater:
                 'total': 47.5,
                 'away_ml': -165,
                 'home_ml': 140,
+                'away_spread_odds': -110,
+                'home_spread_odds': -110,
                 'league': 'NFL'
             },
             {
@@ -860,6 +1173,8 @@ class AutoPilotBettingUpdater:
                 'total': 44.0,
                 'away_ml': -240,
                 'home_ml': 200,
+                'away_spread_odds': -112,
+                'home_spread_odds': -108,
                 'league': 'NFL'
             }
         ]
@@ -875,6 +1190,8 @@ class AutoPilotBettingUpdater:
                 'total': 58.5,
                 'away_ml': 140,
                 'home_ml': -165,
+                'away_spread_odds': -115,
+                'home_spread_odds': -105,
                 'league': 'CFB'
             },
             {
@@ -885,6 +1202,8 @@ class AutoPilotBettingUpdater:
                 'total': 54.5,
                 'away_ml': -280,
                 'home_ml': 230,
+                'away_spread_odds': -108,
+                'home_spread_odds': -112,
                 'league': 'CFB'
             },
             {
@@ -895,32 +1214,44 @@ class AutoPilotBettingUpdater:
                 'total': 62.5,
                 'away_ml': 165,
                 'home_ml': -195,
+                'away_spread_odds': -110,
+                'home_spread_odds': -110,
                 'league': 'CFB'
             }
         ]
 
     def commit_to_github(self):
-        """Automatically commit and push changes to GitHub"""
+        """Commit and push the site files that changed since the last publish to GitHub"""
         try:
-            import subprocess
-            
-            subprocess.run(['git', 'add', '.'], check=True)
             commit_message = f"Pete Prisco Style Update: Week {self.current_week} picks - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            subprocess.run(['git', 'commit', '-m', commit_message], check=True)
-            subprocess.run(['git', 'push', 'origin', 'main'], check=True)
+            published = site_publish.publish_to_git(commit_message)
+            if not published['staged'] and not published['removed']:
+                print("Site output unchanged since the last publish, skipping commit and push")
+                return
             
-            print("Changes committed and pushed to GitHub!")
+            print(f"Changes committed and pushed to GitHub! ({len(published['staged'])} files updated, {len(published['removed'])} removed)")
             print("Vercel will auto-deploy your updated site!")
             
         except subprocess.CalledProcessError as e:
-            print(f"Git operations failed: {e}")
+            print(f"Git operations failed: {e} {(e.stderr or '').strip()}")
         except FileNotFoundError:
             print("Git not found. Please install Git to enable auto-deployment")
+        except OSError as e:
+            print(f"Publish failed: {e}")
+
+    def publish_local(self):
+        """Snapshot the site into a new local version and switch current to it"""
+        published = site_publish.publish_local(self.publish_dir)
+        if published['unchanged']:
+            print(f"Site output unchanged, {self.publish_dir}/current stays on {published['version']}")
+            return
+        print(f"Published {published['version']} to {self.publish_dir}/current "
+              f"({len(published['copied'])} files written, {len(published['linked'])} linked from the previous build)")
 
     def run_full_update(self):
         """Main method to run complete site update"""
         print("STARTING PETE PRISCO STYLE AUTOPILOT UPDATE...")
-        print(f"Week {self.current_week} • Season 2025 • {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        print(f"Week {self.current_week} • Season {self.current_season} • {datetime.now().strftime('%Y-%m-%d %H:%M')}")
         print("="*60)
         
         print("Fetching live NFL games...")
@@ -930,8 +1261,10 @@ class AutoPilotBettingUpdater:
         cfb_raw_games = self.fetch_live_cfb_games()
         
         print("Generating Pete Prisco style analysis...")
-        nfl_games = [self.generate_game_analysis(game) for game in nfl_raw_games]
-        cfb_games = [self.generate_game_analysis(game) for game in cfb_raw_games]
+        nfl_totals = self.project_slate_totals(nfl_raw_games)
+        cfb_totals = self.project_slate_totals(cfb_raw_games)
+        analyses = self.analyze_slate(nfl_raw_games + cfb_raw_games, nfl_totals + cfb_totals)
+        nfl_games, cfb_games = analyses[:len(nfl_raw_games)], analyses[len(nfl_raw_games):]
         
         print(f"Analyzed {len(nfl_games)} NFL games with detailed breakdowns")
         print(f"Analyzed {len(cfb_games)} CFB games")
@@ -939,16 +1272,25 @@ class AutoPilotBettingUpdater:
         print("Building expert parlays...")
         parlays = self.generate_parlays(nfl_games, cfb_games)
         
-        print("Updating HTML site...")
-        self.update_html_site(nfl_games, cfb_games, parlays)
+        if self.render_static_html:
+            print("Updating HTML site...")
+            self.update_html_site(nfl_games, cfb_games, parlays)
+        self.update_picks_json(nfl_games, cfb_games, parlays)
         
-        print("Deploying to GitHub...")
-        self.commit_to_github()
+        if self.publish_target == 'local':
+            print("Publishing local build...")
+            self.publish_local()
+        else:
+            print("Deploying to GitHub...")
+            self.commit_to_github()
         
         print("="*60)
         print("PETE PRISCO STYLE AUTOPILOT UPDATE COMPLETE!")
         print(f"Generated {len(nfl_games)} NFL picks and {len(cfb_games)} CFB picks")
-        print(f"Built NFL parlay ({parlays['nfl']['odds']:+d}) and CFB parlay ({parlays['cfb']['odds']:+d})")
+        print("Built " + " and ".join(
+            f"{league.upper()} parlay ({parlay['odds']:+d})" if parlay['games'] else f"no +EV {league.upper()} parlay"
+            for league, parlay in parlays.items()
+        ))
         print("Site updated with detailed expert analysis!")
 
 
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the updater hot paths
+Usage: python benchmarks.py [name ...]  (no names runs everything)
+"""
+
+import argparse
+import ast
+import builtins
+import gzip
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from html.parser import HTMLParser
+from typing import List, Dict
+
+import bet_builder
+import html_writer
+import parallel_analysis
+import parlay_optimizer
+import prop_engine
+import search_index
+from fragment_cache import FragmentCache
+from player_projections import PlayerProjectionStore
+
+PROP_MARKETS = ['player_pass_tds', 'player_pass_yds', 'player_rush_yds', 'player_receptions']
+
+
+def make_synthetic_prop_outcomes(markets: int, seed: int = 7) -> List[Dict]:
+    """Build a synthetic slate of Over/Under prop outcomes (two per market)"""
+    rng = random.Random(seed)
+    outcomes = []
+    for i in range(markets):
+        game = f"Away {i // 200} @ Home {i // 200}"
+        market = PROP_MARKETS[i % len(PROP_MARKETS)]
+        line = round(rng.uniform(0.5, 300.5)) + 0.5
+        over_odds = rng.choice([-135, -120, -115, -110, -105, 100, 105, 115])
+        for side, odds in (('Over', over_odds), ('Under', -over_odds if abs(over_odds) > 100 else -120)):
+            outcomes.append({
+                'game': game,
+                'event_id': f"evt{i // 200}",
+                'player': f"Player {i // 8}",
+                'market': market,
+                'line': line,
+                'side': side,
+                'odds': odds,
+                'league': 'CFB'
+            })
+    return outcomes
+
+
+def make_synthetic_props(count: int, seed: int = 7) -> List[Dict]:
+    """Build a synthetic slate of paired prop markets"""
+    return prop_engine.pair_prop_outcomes(make_synthetic_prop_outcomes(count, seed))
+
+
+def make_synthetic_analyzed_games(count: int, seed: int = 3) -> List[Dict]:
+    """Build a synthetic slate of analyzed games (game_info, pick, predicted_score)"""
+    rng = random.Random(seed)
+    games = []
+    for i in range(count):
+        spread = rng.choice([-14, -10.5, -8.5, -7.5, -6, -3, 1.5, 2.5, 3.5, 7])
+        side = rng.choice(['home', 'away'])
+        p_over = rng.uniform(0.4, 0.6)
+        games.append({
+            'game_info': {'away_team': f"Away {i}", 'home_team': f"Home {i}", 'spread': spread, 'total': 55.5},
+            'pick': {
+                'team': f"Home {i}" if side == 'home' else f"Away {i}", 'line': f"{spread if side == 'home' else -spread:+g}",
+                'side': side, 'odds': -110, 'confidence': 60,
+                'cover_probability': rng.uniform(0.48, 0.62), 'model_margin': -spread + rng.uniform(-4, 4)
+            },
+            'predicted_score': {'p_over': p_over, 'p_under': 1 - p_over}
+        })
+    return games
+
+
+class DomCounter(HTMLParser):
+    """Counts elements by when the page puts them in the DOM: at load, on the CFB tab switch, or on scroll"""
+
+    def __init__(self):
+        super().__init__()
+        self.templates = []
+        self.counts = {'load': 0, 'tab_switch': 0, 'scroll': 0}
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'template':
+            self.templates.append('scroll' if 'data-card-batch' in dict(attrs) else 'tab_switch')
+            return
+        self.counts['scroll' if 'scroll' in self.templates else self.templates[-1] if self.templates else 'load'] += 1
+
+    def handle_endtag(self, tag):
+        if tag == 'template' and self.templates:
+            self.templates.pop()
+
+
+def bench_props(count: int = 100_000):
+    """Pair, score and rank a large prop slate"""
+    outcomes = make_synthetic_prop_outcomes(count)
+    rng = random.Random(42)
+
+    start = time.perf_counter()
+    props = prop_engine.pair_prop_outcomes(outcomes)
+    paired = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = prop_engine.score_props(prop_engine.props_to_columns(props), rng)
+    top = prop_engine.select_top_props(scores, k=5, min_confidence=70)
+    elapsed = time.perf_counter() - start
+
+    # The updater's path: every prop seeded on its own, so reruns score identically
+    columns = prop_engine.props_to_columns(props)
+    start = time.perf_counter()
+    columns['seed'] = [prop_engine.prop_seed(0, 1, prop) for prop in props]
+    seeded = prop_engine.score_props(columns)
+    seeded_elapsed = time.perf_counter() - start
+    # A rerun sees the same props, possibly in another order; each must score the same
+    repeat = prop_engine.score_props({name: values[::-1] for name, values in columns.items()})
+    repeat = {name: repeat[name][::-1] for name in ('confidence', 'direction')}
+
+    print(f"props: paired {len(outcomes):,} outcomes into {len(props):,} markets in {paired:.3f}s")
+    print(f"props: scored and ranked {len(props):,} props in {elapsed:.3f}s (top {len(top)} kept)")
+    print(f"props: scored with per-prop seeds in {seeded_elapsed:.3f}s, identical on a reordered rescore: "
+          f"{seeded['confidence'] == repeat['confidence'] and seeded['direction'] == repeat['direction']}")
+    return elapsed
+
+
+def bench_projections(players: int = 5000, weeks: int = 12, lookups: int = 100_000):
+    """Incremental projection updates and per-prop lookups across both leagues"""
+    rng = random.Random(11)
+    store = PlayerProjectionStore(path='')
+
+    start = time.perf_counter()
+    for week in range(weeks):
+        for league in ('nfl', 'cfb'):
+            for p in range(players):
+                store.update_player(league, f"Player {p}", {
+                    'pass_yds': rng.uniform(150, 330), 'pass_tds': rng.randint(0, 4),
+                    'rush_yds': rng.uniform(10, 120), 'receptions': rng.randint(0, 9)
+                })
+    updates = weeks * players * 2
+    update_time = time.perf_counter() - start
+
+    names = [f"Player {rng.randrange(players)}" for _ in range(lookups)]
+    markets = [PROP_MARKETS[i % len(PROP_MARKETS)] for i in range(lookups)]
+    start = time.perf_counter()
+    store.project_many(names, 'cfb', markets)
+    lookup_time = time.perf_counter() - start
+
+    print(f"projections: {updates:,} player-game updates in {update_time:.3f}s ({update_time / updates * 1e6:.2f}us each)")
+    print(f"projections: {lookups:,} prop lookups in {lookup_time:.3f}s ({lookup_time / lookups * 1e6:.2f}us each)")
+    return lookup_time
+
+
+def bench_parlay_pricing(count: int = 100_000, legs: int = 3):
+    """Batch-price many candidate parlays"""
+    rng = random.Random(5)
+    prices = [-120, -115, -110, -105, 100, 110, 125]
+    leg_odds = [[rng.choice(prices) for _ in range(legs)] for _ in range(count)]
+    leg_probabilities = [[rng.uniform(0.45, 0.62) for _ in range(legs)] for _ in range(count)]
+
+    start = time.perf_counter()
+    priced = parlay_optimizer.price_parlays(leg_odds, leg_probabilities)
+    elapsed = time.perf_counter() - start
+
+    print(f"parlay pricing: priced {count:,} {legs}-leg parlays in {elapsed:.3f}s "
+          f"(best EV {max(priced['expected_value']) * 100:+.0f}%)")
+    return elapsed
+
+
+def bench_bet_builder(count: int = 60):
+    """Round robins and Wong teasers across a full CFB-sized slate (teasers priced as NFL, the only Wong league)"""
+    games = make_synthetic_analyzed_games(count)
+
+    start = time.perf_counter()
+    round_robins = bet_builder.build_round_robins(games, 'CFB')
+    teasers = bet_builder.build_teasers(games, 'NFL')
+    elapsed = time.perf_counter() - start
+
+    tickets = sum(round_robin['tickets'] for round_robin in round_robins)
+    print(f"bet builder: {tickets} round-robin tickets and {len(teasers)} +EV teasers "
+          f"from a {count}-game slate in {elapsed:.3f}s")
+    return elapsed
+
+
+def bench_parallel_analysis(count: int = 2000, workers: int = 0):
+    """Slate analysis on 1 worker vs a process pool (needs the updater's dependencies)"""
+    from autopilot_updater import AutoPilotBettingUpdater
+
+    workers = workers or os.cpu_count() or 1
+    updater = AutoPilotBettingUpdater()
+    rng = random.Random(9)
+    templates = updater.get_demo_nfl_games() + updater.get_demo_cfb_games()
+    games = []
+    for i in range(count):
+        game = dict(templates[i % len(templates)])
+        game['spread'] = game['spread'] + rng.choice([-1.5, -1, 0, 1, 1.5])
+        game['commence_time'] = f"2025-09-{6 + i // 500:02d}T{i % 24:02d}:00:00Z"
+        games.append(game)
+    totals = updater.project_slate_totals(games)
+
+    timings, results = {}, {}
+    for worker_count in (1, workers):
+        start = time.perf_counter()
+        results[worker_count] = parallel_analysis.analyze_games(updater, games, totals, worker_count, base_seed=1)
+        timings[worker_count] = time.perf_counter() - start
+
+    same = all(a['pick'] == b['pick'] and a['analysis'] == b['analysis'] for a, b in zip(results[1], results[workers]))
+    print(f"parallel analysis: {count:,} games in {timings[1]:.3f}s on 1 worker, "
+          f"{timings[workers]:.3f}s on {workers} ({timings[1] / timings[workers]:.2f}x), identical output: {same}")
+    return timings[workers]
+
+
+# bench_prose's stand-in for the compiled-template approach that was tried for the Prisco write-up
+# and dropped: the same four sections declared as data, for the comparison against the f-string methods
+PROSE_BENCH_SECTIONS = {
+    'the_line': {
+        'clauses': [
+            [
+                ('abs_spread <= 3', "This is essentially a pick 'em game with {home_team} ({home_record}) getting {abs_spread} at home against {away_team} ({away_record}). "),
+                ('abs_spread <= 7', "The {abs_spread}-point spread reflects {home_team}'s ({home_record}) home advantage over {away_team} ({away_record}). "),
+                (None, "That's a big number at {abs_spread} points, but {home_team} ({home_record}) has been much better than {away_team} ({away_record}) this season. "),
+            ],
+            [
+                ('home_ats_wins >= 9', "The home team has been solid against the spread at {home_ats}. "),
+                ('home_ats_wins <= 5', "Home team has struggled ATS this year at {home_ats}. "),
+            ],
+            [
+                ('away_ats_wins >= 9', "The road team has been a good bet at {away_ats} ATS. "),
+                ('away_ats_wins <= 5', "Road team has disappointed bettors at {away_ats} ATS. "),
+            ],
+        ]
+    },
+    'the_matchup': {
+        'clauses': [
+            [
+                ('away_ppg > home_opp_ppg + 5', "{away_team}'s offense ({away_ppg:.1f} PPG) should find success against {home_team}'s defense that allows {home_opp_ppg:.1f} points per game. "),
+                ('home_ppg > away_opp_ppg + 5', "{home_team}'s {home_ppg:.1f} points per game should test {away_team}'s defense allowing {away_opp_ppg:.1f}. "),
+                (None, "Both offenses are evenly matched - {away_team} averages {away_ppg:.1f} while {home_team} puts up {home_ppg:.1f} per game. "),
+            ],
+            [('away_strength and home_weakness', "{away_team}'s {away_strength} could exploit {home_team}'s {home_weakness}. ")],
+            [('home_strength and away_weakness', "{home_team}'s {home_strength} gives them an edge against {away_team}'s {away_weakness}. ")],
+            [(None, "{away_team} comes in on a {away_form} streak, while {home_team} is {home_form} in recent games. ")],
+        ]
+    },
+    'the_angle': {
+        'clauses': [
+            [
+                ('home_home_wins >= 6', "{home_team} has been dominant at home this season ({home_home_record}). "),
+                ('home_home_wins <= 2', "{home_team} has struggled at home ({home_home_record}), which could negate the typical home field advantage. "),
+            ],
+            [
+                ('away_road_wins >= 5', "{away_team} travels well with a {away_road_record} road record. "),
+                ('away_road_wins <= 2', "{away_team}'s poor road record ({away_road_record}) is concerning for this matchup. "),
+            ],
+            [('divisional', "Divisional games are always different - throw the records out when these teams meet. ")],
+            [('outdoor_venue', "Weather could be a factor in this outdoor matchup. ")],
+            [
+                ('away_wins >= 9 or home_wins >= 9', "Playoff implications add extra motivation for both teams. "),
+                ('away_wins <= 4 or home_wins <= 4', "Teams with poor records can be dangerous as they play loose with nothing to lose. "),
+            ],
+        ],
+        'fallback': "Both teams have clear motivations entering this important matchup."
+    },
+    'the_bottom_line': {
+        'clauses': [
+            [(None, "I'm taking {pick_team} {pick_line}. ")],
+            [('reasoning', "{reasoning}. ")],
+            [('ml_team', "There's moneyline value on {ml_team} ({ml_price:+d}), who win {ml_win_probability * 100:.0f}% of the time on our numbers. ")],
+            [
+                ('confidence > 75', "This one feels like a lock based on the matchup and recent form. "),
+                ('confidence > 65', "Multiple factors point to this being the right side. "),
+                (None, "It's a close call, but the numbers lean this way. "),
+            ],
+            [(None, (
+                "Take it and run.",
+                "Lock it in.",
+                "Easy money here.",
+                "This line won't last long.",
+                "The smart money is here.",
+                "I'm confident in this play."
+            ))],
+        ]
+    },
+}
+
+
+def compile_prose_section(spec: Dict):
+    """A section spec as one generated render(ctx, rng) function: if/elif chains of f-strings"""
+    lines, names, pools = [], set(), {}
+    for clause in spec['clauses']:
+        for index, (condition, phrase) in enumerate(clause):
+            if condition is None:
+                lines.append('    else:' if index else '    if True:')
+            else:
+                names |= {node.id for node in ast.walk(ast.parse(condition, mode='eval')) if isinstance(node, ast.Name)}
+                lines.append(f"    {'elif' if index else 'if'} {condition}:")
+            if isinstance(phrase, tuple):
+                pools[f"POOL_{len(pools)}"] = phrase
+                lines.append(f"        out.append(rng.choice(POOL_{len(pools) - 1}))")
+            else:
+                source = 'f' + repr(phrase)
+                names |= {node.id for node in ast.walk(ast.parse(source, mode='eval')) if isinstance(node, ast.Name)}
+                lines.append(f"        out.append({source})")
+    names = {name for name in names if not hasattr(builtins, name)}
+    header = ["def render(ctx, rng):", "    out = []"] + [f"    {name} = ctx[{name!r}]" for name in sorted(names)]
+    namespace = dict(pools, FALLBACK=spec.get('fallback', ''))
+    exec('\n'.join(header + lines + ["    return ''.join(out) or FALLBACK"]), namespace)
+    return namespace['render']
+
+
+def prose_context(updater, team_fields: Dict, game: Dict, pick: Dict, away_data: Dict, home_data: Dict) -> Dict:
+    """What the declared sections read for one game; per-team fields built once per team"""
+    for team, side, data in ((game['away_team'], 'away', away_data), (game['home_team'], 'home', home_data)):
+        if (team, side) in team_fields:
+            continue
+        ats = data.get('ats_record', '7-7')
+        venue = 'road' if side == 'away' else 'home'
+        venue_record = data.get('away_record', '3-4') if side == 'away' else data.get('home_record', '4-3')
+        strengths, weaknesses = data.get('strengths', []), data.get('weaknesses', [])
+        fields = team_fields[(team, side)] = {
+            f'{side}_team': team, f'{side}_record': data['record'], f'{side}_wins': int(data['record'].split('-')[0]),
+            f'{side}_ats': ats, f'{side}_ats_wins': int(ats.split('-')[0]),
+            f'{side}_ppg': data['ppg'], f'{side}_opp_ppg': data['opp_ppg'],
+            f'{side}_strength': strengths[0] if strengths else None,
+            f'{side}_weakness': weaknesses[0] if weaknesses else None,
+            f'{side}_form': data.get('recent_form', 'W1'),
+            f'{side}_{venue}_record': venue_record, f'{side}_{venue}_wins': int(venue_record.split('-')[0])
+        }
+        if side == 'home':
+            stadium = updater.get_venue(team)
+            fields['outdoor_venue'] = 'Field' in stadium or 'Stadium' in stadium and 'Dome' not in stadium
+
+    moneyline = pick.get('moneyline', {})
+    ml_side = moneyline.get('value_side')
+    return {
+        **team_fields[(game['away_team'], 'away')],
+        **team_fields[(game['home_team'], 'home')],
+        'abs_spread': abs(game['spread']),
+        'divisional': updater.is_divisional_game(game['away_team'], game['home_team']),
+        'pick_team': pick['team'],
+        'pick_line': pick['line'],
+        'reasoning': pick.get('primary_reasoning', ''),
+        'ml_team': game[f'{ml_side}_team'] if ml_side else None,
+        'ml_price': game[f'{ml_side}_ml'] if ml_side else None,
+        'ml_win_probability': moneyline[f'{ml_side}_win_probability'] if ml_side else None,
+        'confidence': pick['confidence']
+    }
+
+
+def bench_prose(count: int = 10_000):
+    """Prisco write-ups from the updater's f-string methods vs compiled data-declared sections (needs the updater's dependencies)"""
+    import autopilot_updater
+
+    updater = autopilot_updater.AutoPilotBettingUpdater()
+    rng = random.Random(4)
+    teams = list(updater.nfl_team_data)
+    inputs = []
+    for _ in range(count):
+        away, home = rng.sample(teams, 2)
+        game = {'away_team': away, 'home_team': home, 'spread': rng.choice([-10.5, -7, -3, -1.5, 1, 2.5, 6.5, 9]),
+                'total': 45.5, 'away_ml': 120, 'home_ml': -140, 'league': 'NFL'}
+        away_data, home_data = updater.get_team_data(away), updater.get_team_data(home)
+        inputs.append((game, updater.calculate_smart_pick(game, away_data, home_data), away_data, home_data))
+
+    start = time.perf_counter()
+    methods = []
+    for i, (game, pick, away_data, home_data) in enumerate(inputs):
+        stream = random.Random(i)
+        methods.append({
+            'the_line': updater.generate_prisco_line_analysis(game, away_data, home_data),
+            'the_matchup': updater.generate_prisco_matchup_analysis(game, away_data, home_data),
+            'the_angle': updater.generate_prisco_angle_analysis(game, away_data, home_data),
+            'the_bottom_line': updater.generate_prisco_bottom_line(game, pick, away_data, home_data, stream)
+        })
+    method_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    renderers = {name: compile_prose_section(spec) for name, spec in PROSE_BENCH_SECTIONS.items()}
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    team_fields = {}
+    compiled = []
+    for i, args in enumerate(inputs):
+        context, stream = prose_context(updater, team_fields, *args), random.Random(i)
+        compiled.append({name: render(context, stream) for name, render in renderers.items()})
+    compiled_time = time.perf_counter() - start
+
+    print(f"prose: {count:,} games, f-string methods {method_time / count * 1e6:.1f}us per game; compiled sections "
+          f"{compiled_time / count * 1e6:.1f}us per game with contexts (+{compile_time * 1000:.1f}ms to compile), "
+          f"identical output: {methods == compiled}")
+    return method_time
+
+
+def bench_html_writer(games: int = 30, scale: int = 10):
+    """Peak memory writing index.html as one string vs streamed, at 1x and `scale`x the slate (needs the updater's dependencies)"""
+    from autopilot_updater import AutoPilotBettingUpdater
+
+    updater = AutoPilotBettingUpdater()
+    templates = updater.get_demo_nfl_games()
+    slate = [dict(templates[i % len(templates)], commence_time=f"2025-09-07T{i % 24:02d}:{i // 24 % 60:02d}:00Z")
+             for i in range(games * scale)]
+    analyzed = parallel_analysis.analyze_games(updater, slate, updater.project_slate_totals(slate), base_seed=1)
+    parlays = updater.generate_parlays(analyzed[:games], analyzed[:games])
+
+    def in_memory(path, nfl, cfb):
+        html = updater.generate_html_content(nfl, cfb, parlays)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        return len(html.encode('utf-8'))
+
+    def streamed(path, nfl, cfb):
+        return html_writer.write_atomic(path, updater.iter_html_content(nfl, cfb, parlays))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (games, games * scale):
+            half = count // 2
+            nfl, cfb = analyzed[:half], analyzed[half:count]
+            for name, write in (('one string', in_memory), ('streamed', streamed)):
+                for run in ('cold', 'warm'):
+                    cache_dir = os.path.join(tmp, f"{name}-{count}")
+                    updater.html_fragments = FragmentCache.load('bench', cache_dir)
+                    tracemalloc.start()
+                    start = time.perf_counter()
+                    size = write(os.path.join(tmp, 'index.html'), nfl, cfb)
+                    elapsed = time.perf_counter() - start
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                    updater.html_fragments.save()
+                    print(f"html writer: {count} games ({size / 1024:,.0f} KB page), {name}, {run} cache: "
+                          f"peak {peak / 1024:,.0f} KB in {elapsed:.3f}s")
+    return peak
+
+
+def bench_page_dom(cfb_games: int = 60):
+    """DOM elements the generated page creates at load vs deferred, on a big CFB slate (needs the updater's dependencies)"""
+    from autopilot_updater import AutoPilotBettingUpdater
+
+    updater = AutoPilotBettingUpdater()
+    templates = updater.get_demo_cfb_games()
+    slate = [dict(templates[i % len(templates)], commence_time=f"2025-09-06T{i % 24:02d}:{i // 24:02d}:00Z")
+             for i in range(cfb_games)]
+    nfl_slate = updater.get_demo_nfl_games()
+    nfl = parallel_analysis.analyze_games(updater, nfl_slate, updater.project_slate_totals(nfl_slate), base_seed=1)
+    cfb = parallel_analysis.analyze_games(updater, slate, updater.project_slate_totals(slate), base_seed=1)
+    parlays = updater.generate_parlays(nfl, cfb[:12])
+
+    start = time.perf_counter()
+    html = updater.generate_html_content(nfl, cfb, parlays)
+    elapsed = time.perf_counter() - start
+
+    counter = DomCounter()
+    counter.feed(html)
+    counts = counter.counts
+    total = sum(counts.values())
+    print(f"page dom: {len(nfl)} NFL + {cfb_games} CFB games, {total:,} elements in the page ({len(html) / 1024:,.0f} KB, "
+          f"rendered in {elapsed:.3f}s); {counts['load']:,} in the DOM at load, +{counts['tab_switch']:,} on the CFB tab switch, "
+          f"+{counts['scroll']:,} as CFB cards scroll in")
+    return counts['load']
+
+
+def bench_search_index(cards: int = 120):
+    """Build the card search index for a big week and measure what the page has to carry"""
+    teams = [team for group in search_index.CFB_CONFERENCES.values() for team in group]
+    games = make_synthetic_analyzed_games(cards)
+    for i, game in enumerate(games):
+        away, home = teams[(2 * i) % len(teams)], teams[(2 * i + 1) % len(teams)]
+        game['game_info'].update(away_team=away, home_team=home)
+        game['pick']['team'] = home if game['pick']['side'] == 'home' else away
+
+    start = time.perf_counter()
+    index = search_index.build_index({'CFB': games}, 12)
+    elapsed = time.perf_counter() - start
+    tag = search_index.script_tag(index)
+    gz = len(gzip.compress(tag.encode('utf-8'), compresslevel=9))
+    print(f"search index: {cards} cards, {len(index['terms'])} terms, built in {elapsed * 1000:.1f}ms, "
+          f"{len(tag) / 1024:.1f} KB inline ({gz / 1024:.1f} KB gzipped)")
+    return len(tag)
+
+
+class StandInWebhook:
+    """Local stand-in for a Discord webhook: a small rate-limit bucket, a 502 on the first try of
+    every fifth message, and a 400 for anything over the embed limits"""
+
+    def __init__(self, limit: int = 5, window: float = 0.5):
+        self.limit = limit
+        self.window = window
+        self.window_start = 0.0
+        self.used = 0
+        self.received = {}
+        self.duplicates = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.faulted = set()
+
+    async def handle(self, request):
+        from aiohttp import web
+        import discord_dispatch
+
+        now = time.monotonic()
+        if now - self.window_start >= self.window:
+            self.window_start, self.used = now, 0
+        reset_after = self.window - (now - self.window_start)
+        if self.used >= self.limit:
+            self.throttled += 1
+            return web.json_response({'message': 'You are being rate limited.', 'retry_after': reset_after, 'global': False}, status=429)
+        self.used += 1
+        headers = {'X-RateLimit-Limit': str(self.limit), 'X-RateLimit-Remaining': str(self.limit - self.used),
+                   'X-RateLimit-Reset-After': f"{reset_after:.3f}", 'X-RateLimit-Bucket': 'stand-in'}
+
+        message = await request.json()
+        embeds = message.get('embeds', [])
+        if (len(embeds) > discord_dispatch.MESSAGE_EMBED_LIMIT
+                or sum(discord_dispatch.embed_size(embed) for embed in embeds) > discord_dispatch.EMBED_TOTAL_LIMIT
+                or any(len(embed.get('fields', [])) > discord_dispatch.FIELD_LIMIT for embed in embeds)
+                or any(len(field['value']) > discord_dispatch.FIELD_VALUE_LIMIT for embed in embeds for field in embed.get('fields', []))):
+            self.rejected += 1
+            return web.json_response({'message': 'Invalid Form Body'}, status=400, headers=headers)
+
+        key = discord_dispatch.message_key(message)
+        if len(self.received) % 5 == 4 and key not in self.faulted:
+            self.faulted.add(key)
+            return web.json_response({'message': 'Bad Gateway'}, status=502, headers=headers)
+        if key in self.received:
+            self.duplicates += 1
+        self.received[key] = str(len(self.received) + 1)
+        return web.json_response({'id': self.received[key]}, headers=headers)
+
+
+def bench_discord_dispatch(picks: int = 2000):
+    """Send a long alert through the dispatcher to a local stand-in webhook (needs aiohttp)"""
+    import asyncio
+    from aiohttp import web
+    import discord_dispatch
+
+    pick_lines = ''.join(f"**Away {i} @ Home {i}**\nPick: Home{i} -3.5 ({75 + i % 20}%)\n\n" for i in range(picks))
+    payload = {'embeds': [{
+        'title': "🔥 WHATABARBER'S ELITE PICKS ALERT 🔥", 'description': 'Week 1', 'color': 0x00ff41,
+        'fields': [{'name': '⚡ HIGH CONFIDENCE SINGLES', 'value': pick_lines, 'inline': False}],
+        'footer': {'text': '💰 Auto-Updated'}, 'timestamp': '2025-09-07T12:00:00'
+    }]}
+    server = StandInWebhook()
+
+    async def run():
+        app = web.Application()
+        app.router.add_post('/api/webhooks/{id}/{token}', server.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            start = time.perf_counter()
+            async with discord_dispatch.DiscordDispatcher(f"http://127.0.0.1:{port}/api/webhooks/1/token") as dispatcher:
+                keys = dispatcher.enqueue(payload)
+                # Re-queueing the same alert mid-flight must not post anything twice
+                dispatcher.enqueue(payload)
+            elapsed = time.perf_counter() - start
+        finally:
+            await runner.cleanup()
+        return dispatcher, keys, elapsed
+
+    dispatcher, keys, elapsed = asyncio.run(run())
+    print(f"discord dispatch: {picks} picks -> {len(keys)} messages in {elapsed:.2f}s; {dispatcher.summary()}; "
+          f"stand-in saw {server.throttled} 429s, {server.rejected} over-limit, {server.duplicates} duplicates")
+    return len(dispatcher.failed) + server.duplicates + server.rejected
+
+
+BENCHMARKS = {
+    'props': bench_props,
+    'projections': bench_projections,
+    'parlay_pricing': bench_parlay_pricing,
+    'bet_builder': bench_bet_builder,
+    'parallel_analysis': bench_parallel_analysis,
+    'prose': bench_prose,
+    'html_writer': bench_html_writer,
+    'page_dom': bench_page_dom,
+    'search_index': bench_search_index,
+    'discord_dispatch': bench_discord_dispatch,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('names', nargs='*', help=f"benchmarks to run ({', '.join(BENCHMARKS)})")
+    args = parser.parse_args()
+
+    for name in args.names or list(BENCHMARKS):
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+ROUND ROBIN & TEASER BUILDER
+Enumerates round-robin tickets (by 2s, 3s, ...) from the slate's best parlay legs
+and Wong-style 6-point teasers across key numbers (NFL only), priced in batches with a combo cap
+"""
+
+import math
+from itertools import combinations
+from typing import List, Dict, Tuple
+
+import margin_tables
+import parlay_correlation
+import parlay_optimizer
+
+MAX_COMBOS = 250
+ROUND_ROBIN_SIZES = (2, 3)
+TEASER_SIZES = (2, 3)
+TEASER_POINTS = 6
+TOP_TICKETS = 5
+
+# Standard 6-point teaser prices by number of legs
+TEASER_ODDS = {2: -120, 3: 160, 4: 260}
+
+# Wong windows on the home/away spread: favorites teased through 7 and 3,
+# underdogs teased up through 3 and 7
+WONG_FAVORITE_SPREADS = (-8.5, -7.5)
+WONG_UNDERDOG_SPREADS = (1.5, 2.5)
+# The windows rest on the NFL's 3/7 margin spikes; CFB margins are too spread out for them to hold
+WONG_LEAGUES = ('NFL',)
+
+
+def pool_size(candidates: int, sizes: Tuple[int, ...], max_combos: int) -> int:
+    """Largest pool of top legs whose combinations over all sizes stay within the cap"""
+    pool = 0
+    while pool < candidates and sum(math.comb(pool + 1, k) for k in sizes) <= max_combos:
+        pool += 1
+    return pool
+
+
+def build_round_robins(games: List[Dict], league: str, sizes: Tuple[int, ...] = ROUND_ROBIN_SIZES,
+                       max_combos: int = MAX_COMBOS) -> List[Dict]:
+    """Round robins by each size over the best +EV legs, one summary per size"""
+    legs = [leg for leg in parlay_optimizer.build_legs(games, league) if leg['probability'] * leg['decimal_odds'] > 1]
+    legs.sort(key=lambda leg: leg['probability'] * leg['decimal_odds'], reverse=True)
+    pool = legs[:pool_size(len(legs), sizes, max_combos)]
+
+    round_robins = []
+    for size in sizes:
+        tickets = [
+            combo for combo in combinations(pool, size)
+            if len({(leg['game_id'], leg['market']) for leg in combo}) == size
+        ]
+        if not tickets:
+            continue
+        priced = parlay_optimizer.price_parlays(
+            [[leg['odds'] for leg in combo] for combo in tickets],
+            [[leg['probability'] for leg in combo] for combo in tickets],
+            [parlay_correlation.parlay_lift(list(combo)) for combo in tickets]
+        )
+        expected_values = priced['expected_value']
+        best = sorted(range(len(tickets)), key=expected_values.__getitem__, reverse=True)[:TOP_TICKETS]
+        round_robins.append({
+            'size': size,
+            'tickets': len(tickets),
+            'legs': [leg['label'] for leg in pool],
+            'expected_value': round(sum(expected_values) / len(tickets), 4),
+            'expected_profit_units': round(sum(expected_values), 2),
+            'top_tickets': [
+                {
+                    'legs': [leg['label'] for leg in tickets[i]],
+                    'odds': priced['american_odds'][i],
+                    'probability': round(priced['model_probability'][i], 4),
+                    'expected_value': round(expected_values[i], 4)
+                } for i in best
+            ]
+        })
+    return round_robins
+
+
+def wong_teaser_legs(games: List[Dict], league: str, points: float = TEASER_POINTS) -> List[Dict]:
+    """Sides whose spread lets a 6-point tease cross both 3 and 7"""
+    tables = margin_tables.load_tables()
+    legs = []
+    for game in games:
+        info, pick = game['game_info'], game['pick']
+        model_margin = pick.get('model_margin', 0)
+        for side, team, spread in (('home', info['home_team'], info['spread']), ('away', info['away_team'], -info['spread'])):
+            in_favorite_window = WONG_FAVORITE_SPREADS[0] <= spread <= WONG_FAVORITE_SPREADS[1]
+            in_underdog_window = WONG_UNDERDOG_SPREADS[0] <= spread <= WONG_UNDERDOG_SPREADS[1]
+            if not (in_favorite_window or in_underdog_window):
+                continue
+            legs.append({
+                'game_id': f"{info['away_team']} @ {info['home_team']}",
+                'label': f"{team} {margin_tables.line_label(spread + points)}",
+                'probability': tables.teaser_cover_probability(league, info['spread'], model_margin, side, points)
+            })
+    return legs
+
+
+def build_teasers(games: List[Dict], league: str, sizes: Tuple[int, ...] = TEASER_SIZES,
+                  max_combos: int = MAX_COMBOS) -> List[Dict]:
+    """Best +EV Wong teaser tickets, one leg per game; none outside WONG_LEAGUES"""
+    if league.upper() not in WONG_LEAGUES:
+        return []
+    legs = sorted(wong_teaser_legs(games, league), key=lambda leg: leg['probability'], reverse=True)
+    pool = legs[:pool_size(len(legs), sizes, max_combos)]
+
+    tickets = [
+        combo for size in sizes if size in TEASER_ODDS for combo in combinations(pool, size)
+        if len({leg['game_id'] for leg in combo}) == size
+    ]
+    if not tickets:
+        return []
+
+    # A teaser pays one fixed price, so each odds row holds that single price
+    priced = parlay_optimizer.price_parlays(
+        [[TEASER_ODDS[len(combo)]] for combo in tickets],
+        [[leg['probability'] for leg in combo] for combo in tickets]
+    )
+    expected_values = priced['expected_value']
+    best = [i for i in sorted(range(len(tickets)), key=expected_values.__getitem__, reverse=True)[:TOP_TICKETS]
+            if expected_values[i] > 0]
+    return [
+        {
+            'legs': [leg['label'] for leg in tickets[i]],
+            'odds': TEASER_ODDS[len(tickets[i])],
+            'probability': round(priced['model_probability'][i], 4),
+            'expected_value': round(expected_values[i], 4)
+        } for i in best
+    ]
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+DISCORD ALERT DISPATCHER
+Queues webhook messages and sends them in order over one persistent session, splitting
+embeds to Discord's limits, waiting out rate-limit buckets from the response headers, and
+retrying 429s, 5xx and dropped connections without ever re-posting a delivered message
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from typing import List, Dict, Optional
+
+import aiohttp
+
+# Discord's documented embed and message limits
+TITLE_LIMIT = 256
+DESCRIPTION_LIMIT = 4096
+FIELD_LIMIT = 25
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+FOOTER_LIMIT = 2048
+EMBED_TOTAL_LIMIT = 6000
+MESSAGE_EMBED_LIMIT = 10
+
+# Room kept in a split embed's title for its " (2/3)" page number
+PAGE_SUFFIX_ROOM = 8
+
+
+def _truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit - 1] + '…'
+
+
+def embed_size(embed: Dict) -> int:
+    """Characters Discord counts against an embed's 6000 total"""
+    size = len(embed.get('title', '')) + len(embed.get('description', ''))
+    size += sum(len(field['name']) + len(field['value']) for field in embed.get('fields', []))
+    size += len(embed.get('footer', {}).get('text', '')) + len(embed.get('author', {}).get('name', ''))
+    return size
+
+
+def split_field(field: Dict) -> List[Dict]:
+    """A field whose value is over 1024 characters as several, cut at line breaks"""
+    name = _truncate(field['name'], FIELD_NAME_LIMIT)
+    chunks, current = [], ''
+    for line in field['value'].split('\n'):
+        while len(line) > FIELD_VALUE_LIMIT:
+            if current:
+                chunks.append(current)
+                current = ''
+            chunks.append(line[:FIELD_VALUE_LIMIT])
+            line = line[FIELD_VALUE_LIMIT:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > FIELD_VALUE_LIMIT:
+            chunks.append(current)
+            candidate = line
+        current = candidate
+    chunks.append(current)
+
+    chunks = [chunk.strip('\n') for chunk in chunks if chunk.strip()] or ['\u200b']
+    return [
+        dict(field, name=name if i == 0 else _truncate(f"{field['name']} (cont.)", FIELD_NAME_LIMIT), value=chunk)
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+def split_embed(embed: Dict) -> List[Dict]:
+    """One embed as as many as it takes to keep each under 25 fields and 6000 characters
+
+    The first page keeps the description, thumbnail and image, the last the footer and
+    timestamp, and every page the title (numbered) and color.
+    """
+    fields = [part for field in embed.get('fields', []) for part in split_field(field)]
+    head = {key: value for key, value in embed.items() if key not in ('fields', 'footer', 'timestamp')}
+    if 'title' in head:
+        head['title'] = _truncate(head['title'], TITLE_LIMIT - PAGE_SUFFIX_ROOM)
+    if 'description' in head:
+        head['description'] = _truncate(head['description'], DESCRIPTION_LIMIT)
+    tail = {key: embed[key] for key in ('footer', 'timestamp') if key in embed}
+    if 'footer' in tail:
+        tail['footer'] = dict(tail['footer'], text=_truncate(tail['footer'].get('text', ''), FOOTER_LIMIT))
+    reserved = embed_size(tail) + PAGE_SUFFIX_ROOM
+
+    pages, page = [], dict(head, fields=[])
+    for field in fields:
+        field_size = len(field['name']) + len(field['value'])
+        # A long description can fill the first page on its own
+        if (page['fields'] or page.get('description')) and (
+                len(page['fields']) == FIELD_LIMIT or embed_size(page) + field_size + reserved > EMBED_TOTAL_LIMIT):
+            pages.append(page)
+            page = {key: head[key] for key in ('title', 'color', 'url') if key in head}
+            page['fields'] = []
+        page['fields'].append(field)
+    pages.append(page)
+    pages[-1].update(tail)
+
+    if len(pages) > 1 and 'title' in head:
+        for i, page in enumerate(pages):
+            page['title'] = f"{head['title']} ({i + 1}/{len(pages)})"
+    for page in pages:
+        if not page['fields']:
+            del page['fields']
+    return pages
+
+
+def pack_messages(payload: Dict) -> List[Dict]:
+    """A webhook payload as messages that each fit Discord's limits, in order
+
+    Only the first message keeps the payload's content; username and avatar go on all.
+    """
+    embeds = [page for embed in payload.get('embeds', []) for page in split_embed(embed)]
+    common = {key: value for key, value in payload.items() if key not in ('embeds', 'content')}
+    messages, current, size = [], [], 0
+    for embed in embeds:
+        if current and (len(current) == MESSAGE_EMBED_LIMIT or size + embed_size(embed) > EMBED_TOTAL_LIMIT):
+            messages.append(dict(common, embeds=current))
+            current, size = [], 0
+        current.append(embed)
+        size += embed_size(embed)
+    if current or not messages:
+        messages.append(dict(common, embeds=current))
+    if payload.get('content'):
+        messages[0]['content'] = payload['content']
+    return messages
+
+
+def message_key(message: Dict) -> str:
+    """Idempotency key: the same message always gets the same key"""
+    return hashlib.sha256(json.dumps(message, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()[:16]
+
+
+class DiscordDispatcher:
+    """Sends queued messages to one webhook in order; use as `async with`, which drains the queue on exit"""
+
+    def __init__(self, webhook_url: str, max_retries: int = 5, timeout: float = 10.0,
+                 session: Optional[aiohttp.ClientSession] = None):
+        self.webhook_url = webhook_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = session
+        self.owns_session = session is None
+        self.queue = None
+        self.worker = None
+
+        # The route's rate-limit bucket as Discord last reported it, and any global pause
+        self.bucket = {'id': None, 'remaining': 1, 'reset_at': 0.0}
+        self.global_until = 0.0
+
+        self.pending = set()
+        self.delivered = {}
+        self.failed = {}
+        self.retries = 0
+        self.rate_limited = 0
+
+    async def __aenter__(self) -> 'DiscordDispatcher':
+        if self.session is None:
+            self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        self.queue = asyncio.Queue()
+        self.worker = asyncio.create_task(self._work())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        try:
+            if exc_info[0] is None:
+                await self.drain()
+        finally:
+            self.worker.cancel()
+            try:
+                await self.worker
+            except asyncio.CancelledError:
+                pass
+            if self.owns_session:
+                await self.session.close()
+
+    def enqueue(self, payload: Dict) -> List[str]:
+        """Split a payload into compliant messages and queue the ones not already sent or queued
+
+        Returns every message's key, so callers can look them up in delivered/failed.
+        """
+        keys = []
+        for message in pack_messages(payload):
+            key = message_key(message)
+            keys.append(key)
+            if key in self.delivered or key in self.pending:
+                continue
+            self.pending.add(key)
+            self.queue.put_nowait((key, message))
+        return keys
+
+    async def drain(self):
+        """Wait until every queued message is delivered or has given up"""
+        await self.queue.join()
+
+    def summary(self) -> str:
+        return (f"{len(self.delivered)} messages sent, {len(self.failed)} failed, "
+                f"{self.retries} retries ({self.rate_limited} rate limited)")
+
+    async def _work(self):
+        while True:
+            key, message = await self.queue.get()
+            try:
+                await self._deliver(key, message)
+            except Exception as e:
+                self.failed[key] = f"{type(e).__name__}: {e}"
+            finally:
+                self.pending.discard(key)
+                self.queue.task_done()
+
+    async def _wait_for_bucket(self):
+        now = time.monotonic()
+        wait = self.global_until - now
+        if self.bucket['remaining'] <= 0:
+            wait = max(wait, self.bucket['reset_at'] - now)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _update_bucket(self, headers):
+        """Track the bucket from X-RateLimit-* headers; a new bucket id replaces the old state"""
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+        self.bucket = {
+            'id': headers.get('X-RateLimit-Bucket', self.bucket['id']),
+            'remaining': int(headers['X-RateLimit-Remaining']),
+            'reset_at': time.monotonic() + float(headers.get('X-RateLimit-Reset-After', 0))
+        }
+
+    @staticmethod
+    async def _json(response: aiohttp.ClientResponse) -> Dict:
+        try:
+            body = await response.json(content_type=None)
+        except ValueError:
+            return {}
+        return body if isinstance(body, dict) else {}
+
+    async def _deliver(self, key: str, message: Dict):
+        """POST one message until Discord acknowledges it, the retries run out, or it's rejected outright"""
+        attempt = 0
+        while True:
+            await self._wait_for_bucket()
+            try:
+                # wait=true makes Discord answer only once the message exists, with its id
+                async with self.session.post(self.webhook_url, params={'wait': 'true'}, json=message) as response:
+                    self._update_bucket(response.headers)
+                    if response.status in (200, 204):
+                        body = await self._json(response) if response.status == 200 else {}
+                        self.delivered[key] = body.get('id', '')
+                        return
+                    if response.status == 429:
+                        body = await self._json(response)
+                        delay = float(body.get('retry_after') or response.headers.get('Retry-After', 1))
+                        if body.get('global') or response.headers.get('X-RateLimit-Global'):
+                            self.global_until = time.monotonic() + delay
+                        else:
+                            self.bucket.update(remaining=0, reset_at=time.monotonic() + delay)
+                        self.rate_limited += 1
+                        reason, delay = 'HTTP 429', 0
+                    elif response.status >= 500:
+                        reason, delay = f"HTTP {response.status}", min(30.0, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.0)
+                    else:
+                        # 4xx other than 429 won't succeed on a resend
+                        self.failed[key] = f"HTTP {response.status}: {(await response.text())[:200]}"
+                        return
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                reason, delay = f"{type(e).__name__}: {e}", min(30.0, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+            attempt += 1
+            if attempt > self.max_retries:
+                self.failed[key] = reason
+                return
+            self.retries += 1
+            if delay:
+                await asyncio.sleep(delay)
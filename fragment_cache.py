@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+HTML FRAGMENT CACHE
+Game cards and parlay blocks rendered once per distinct input and reused between runs
+Key = hash of (fragment kind, renderer source, inputs), so a template edit re-renders everything
+Each fragment is its own file and is read back only when the page reaches it, so the cache
+never holds a whole page in memory while the page streams to disk
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from functools import lru_cache
+from typing import Any, Callable
+
+CACHE_DIR = 'data/fragment_cache'
+
+
+@lru_cache(maxsize=None)
+def renderer_digest(render: Callable) -> str:
+    """Digest of a render function's source"""
+    try:
+        source = inspect.getsource(render)
+    except (OSError, TypeError):
+        source = getattr(render, '__qualname__', repr(render))
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:12]
+
+
+class FragmentCache:
+    def __init__(self, prefix: str, cache_dir: str = CACHE_DIR):
+        self.prefix = prefix
+        self.cache_dir = cache_dir
+        # Keys with a fragment on disk; only a loaded cache reads or writes them
+        self.stored = set()
+        self.persist = False
+        self.used = set()
+        self.rendered = 0
+        self.reused = 0
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.cache_dir, self.prefix)
+
+    @classmethod
+    def load(cls, prefix: str, cache_dir: str = CACHE_DIR) -> 'FragmentCache':
+        """Index of fragments saved by earlier runs, or an empty cache"""
+        cache = cls(prefix, cache_dir)
+        cache.persist = True
+        if os.path.isdir(cache.path):
+            cache.stored = {name[:-5] for name in os.listdir(cache.path) if name.endswith('.html')}
+        return cache
+
+    def render(self, kind: str, inputs: Any, render: Callable, *args, helpers: tuple = ()) -> str:
+        """Cached HTML for render(*args), keyed by the inputs it reads
+
+        helpers are other render functions it calls, so their edits invalidate it too.
+        """
+        digests = ':'.join(renderer_digest(getattr(func, '__func__', func)) for func in (render,) + helpers)
+        payload = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str)
+        key = hashlib.blake2b(f"{kind}:{digests}:{payload}".encode('utf-8'), digest_size=16).hexdigest()
+
+        self.used.add(key)
+        if key in self.stored:
+            try:
+                with open(self.fragment_path(key), 'r', encoding='utf-8') as f:
+                    html = f.read()
+                self.reused += 1
+                return html
+            except OSError:
+                self.stored.discard(key)
+
+        html = render(*args)
+        self.rendered += 1
+        if self.persist:
+            self.store(key, html)
+        return html
+
+    def fragment_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.html")
+
+    def store(self, key: str, html: str):
+        os.makedirs(self.path, exist_ok=True)
+        temp_path = self.fragment_path(key) + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        os.replace(temp_path, self.fragment_path(key))
+        self.stored.add(key)
+
+    def save(self):
+        """Delete the fragments this run's page didn't use (new ones are written as they render)"""
+        for key in self.stored - self.used:
+            try:
+                os.remove(self.fragment_path(key))
+            except OSError:
+                pass
+        self.stored &= self.used
+
+    def summary(self) -> str:
+        return f"{self.rendered} fragments rendered, {self.reused} reused"
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+HTML MINIFY & PRECOMPRESS
+Post-render stage for the generated page: strips indentation whitespace and comments
+from the section stream (leaving <script>, <pre> and <textarea> content untouched), then
+writes max-compression .gz and .br siblings for hosts that serve precompressed files
+"""
+
+import gzip
+import os
+import re
+import time
+from typing import List, Dict, Iterable, Iterator, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+RAW_BLOCK = re.compile(r'(<(script|pre|textarea)\b.*?</\2\s*>)', re.S | re.I)
+OPENERS = re.compile(r'<(script|pre|textarea)\b|<!--', re.I)
+COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.S)
+# Whitespace between tags that spans a line break is source indentation, not content
+INTER_TAG = re.compile(r'>\s*\n\s*<')
+LEADING_INDENT = re.compile(r'^\s*\n\s*(?=<)')
+SPACES = re.compile(r'\s+')
+
+
+def minify(html: str) -> str:
+    """Minify a complete stretch of HTML"""
+    parts = RAW_BLOCK.split(html)
+    out = []
+    # split() yields text, raw block, tag name, text, ...
+    for i in range(0, len(parts), 3):
+        text = COMMENT.sub('', parts[i])
+        out.append(SPACES.sub(' ', INTER_TAG.sub('><', text)))
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    return ''.join(out)
+
+
+def _safe_cut(buffer: str) -> int:
+    """Length of the buffer's prefix that ends on a tag and leaves no raw block or comment open"""
+    limit = len(buffer)
+    for match in OPENERS.finditer(buffer):
+        closer = '-->' if match.group(0) == '<!--' else f"</{match.group(1).lower()}"
+        if closer not in buffer[match.end():].lower():
+            limit = match.start()
+            break
+    return buffer.rfind('>', 0, limit) + 1
+
+
+def minify_chunks(chunks: Iterable[str], stats: Optional[Dict] = None) -> Iterator[str]:
+    """Minify a page as it streams, holding back only an unfinished tag, raw block or comment
+
+    stats, when given, gets the input size and time spent minifying.
+    """
+    buffer, first, input_bytes, seconds = '', True, 0, 0.0
+    for chunk in chunks:
+        input_bytes += len(chunk.encode('utf-8'))
+        buffer += chunk
+        start = time.perf_counter()
+        cut = _safe_cut(buffer)
+        if cut:
+            segment, buffer = buffer[:cut], buffer[cut:]
+            if not first:
+                segment = LEADING_INDENT.sub('', segment)
+            first = False
+            segment = minify(segment)
+        seconds += time.perf_counter() - start
+        if cut:
+            yield segment
+    if buffer:
+        start = time.perf_counter()
+        segment = minify(buffer if first else LEADING_INDENT.sub('', buffer))
+        seconds += time.perf_counter() - start
+        yield segment
+    if stats is not None:
+        stats.update(input_bytes=input_bytes, seconds=seconds)
+
+
+def _write(path: str, data: bytes):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def write_precompressed(path: str) -> List[Dict]:
+    """Write path.gz and path.br (when brotli is installed) at max compression
+
+    Returns one {'path', 'bytes', 'seconds'} entry per artifact. A stale .br is
+    removed when brotli isn't available, so it can't be served for a newer page.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    artifacts = []
+    compressors = [('.gz', lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        compressors.append(('.br', lambda raw: brotli.compress(raw, quality=11)))
+    elif os.path.exists(path + '.br'):
+        os.remove(path + '.br')
+
+    for suffix, compress in compressors:
+        start = time.perf_counter()
+        compressed = compress(data)
+        elapsed = time.perf_counter() - start
+        _write(path + suffix, compressed)
+        artifacts.append({'path': path + suffix, 'bytes': len(compressed), 'seconds': elapsed})
+    return artifacts
+
+
+def describe(path: str, stats: Dict, size: int, artifacts: List[Dict]) -> str:
+    """One-line size report for the minified page and its compressed siblings"""
+    parts = [f"{path} {stats['input_bytes'] / 1024:.1f} KB -> {size / 1024:.1f} KB minified in {stats['seconds'] * 1000:.1f}ms"]
+    parts += [f"{os.path.basename(a['path'])} {a['bytes'] / 1024:.1f} KB in {a['seconds'] * 1000:.1f}ms" for a in artifacts]
+    if brotli is None:
+        parts.append(".br skipped (pip install brotli)")
+    return ', '.join(parts)
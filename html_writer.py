@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+STREAMING HTML WRITER
+Writes a page from a generator of sections into a temp file beside the target,
+fsyncs it and renames it into place, so the site never serves a half-written page
+and the full document is never held in memory
+"""
+
+import os
+from typing import Iterable
+
+
+def write_atomic(path: str, chunks: Iterable[str], encoding: str = 'utf-8') -> int:
+    """Stream chunks to path atomically; returns the bytes written
+
+    If rendering or writing fails, the old file is left untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        size = os.path.getsize(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    # Persist the rename itself; not every platform can open a directory
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return size
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+    return size
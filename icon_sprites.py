@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+INLINE ICON SPRITES
+Resolves the Lucide icons a page references (<use href="#icon-NAME">) at build time from the
+vendored set in icons/lucide, and inlines them as one hidden SVG sprite sheet, instead of
+loading the whole library from a CDN and rewriting the DOM in the browser
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import List, Iterable, Iterator
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons', 'lucide')
+
+ICON_REF = re.compile(r'href="#icon-([\w-]+)"')
+SVG_BODY = re.compile(r'<svg\b[^>]*>(.*)</svg>', re.S)
+
+# Lucide's stroke style, set once on each symbol and inherited by its shapes
+SYMBOL_ATTRIBUTES = 'viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"'
+
+
+@lru_cache(maxsize=None)
+def icon_body(name: str, icon_dir: str = ICON_DIR) -> str:
+    """The shapes inside a vendored icon's <svg>"""
+    with open(os.path.join(icon_dir, f"{name}.svg"), 'r', encoding='utf-8') as f:
+        match = SVG_BODY.search(f.read())
+    if not match:
+        raise ValueError(f"{name}.svg has no <svg> element")
+    return re.sub(r'\s*/>', '/>', match.group(1).strip())
+
+
+def sprite_sheet(names: List[str], icon_dir: str = ICON_DIR) -> str:
+    """Hidden <svg> holding one <symbol id="icon-NAME"> per icon"""
+    if not names:
+        return ''
+    symbols = ''.join(f'<symbol id="icon-{name}" {SYMBOL_ATTRIBUTES}>{icon_body(name, icon_dir)}</symbol>' for name in names)
+    return f'<svg xmlns="http://www.w3.org/2000/svg" style="display:none">{symbols}</svg>'
+
+
+def inline_sprites(chunks: Iterable[str], icon_dir: str = ICON_DIR) -> Iterator[str]:
+    """Pass a page's chunks through, adding a sprite sheet for every icon they use just before </body>"""
+    used, pending = [], None
+    for chunk in chunks:
+        if pending is not None:
+            yield pending
+        for name in ICON_REF.findall(chunk):
+            if name not in used:
+                used.append(name)
+        pending = chunk
+    if pending is None:
+        return
+
+    head, body_end, tail = pending.rpartition('</body>')
+    if not body_end:
+        yield pending + sprite_sheet(used, icon_dir)
+        return
+    yield head + sprite_sheet(used, icon_dir) + body_end + tail
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+KEY NUMBER MARGIN TABLES
+Final-margin distributions with the 3/7/10/14 spikes, precomputed per league
+Rebuild from historical results: python margin_tables.py results.csv [more.csv ...]
+CSV columns: league,home_score,away_score
+"""
+
+import csv
+import json
+import math
+import os
+import sys
+from typing import List, Dict, Optional
+
+from prop_engine import implied_probability
+
+TABLES_PATH = 'data/margin_tables.json'
+
+MAX_MARGIN = 80
+MAX_MODEL_MARGIN = 40  # model margins are clamped to +/- this on a half-point grid
+KEY_WEIGHT_LIMITS = (0.2, 5.0)
+# Key numbers are one-to-three-score margins; past this the weight is 1 and the normal curve's own tail applies
+KEY_WEIGHT_MAX_MARGIN = 21
+
+# Std dev of the final margin around the model's expected margin
+RESIDUAL_SIGMA = {'NFL': 13.5, 'CFB': 16.5}
+
+# Share of games (%) decided by each absolute margin 0..21, used when no
+# historical results file has been loaded. NFL shape from long-run results;
+# CFB shares the key numbers but far less sharply.
+PRIOR_ABS_MARGIN_SHARES = {
+    'NFL': [0.3, 3.5, 3.8, 14.8, 5.0, 3.5, 6.0, 9.3, 3.6, 2.3, 5.7,
+            3.0, 2.3, 2.5, 4.7, 2.2, 2.5, 3.4, 2.1, 1.6, 1.8, 2.2],
+    'CFB': [0.0, 3.0, 3.0, 8.5, 4.2, 3.2, 4.4, 6.6, 3.4, 2.6, 4.5,
+            3.0, 2.6, 2.7, 4.0, 2.5, 2.5, 3.2, 2.3, 2.0, 2.0, 2.6],
+}
+PRIOR_TAIL_DECAY = {'NFL': 0.90, 'CFB': 0.94}
+
+_tables = None
+
+
+def _normal_pdf(x: float, sigma: float) -> float:
+    return math.exp(-0.5 * (x / sigma) ** 2) / (sigma * math.sqrt(2 * math.pi))
+
+
+def prior_abs_margin_counts(league: str) -> List[float]:
+    """Prior absolute-margin frequencies 0..MAX_MARGIN for a league"""
+    shares = list(PRIOR_ABS_MARGIN_SHARES[league])
+    remaining = max(100 - sum(shares), 0.0)
+    decay = PRIOR_TAIL_DECAY[league]
+    tail = [decay ** i for i in range(1, MAX_MARGIN - len(shares) + 2)]
+    scale = remaining / sum(tail)
+    return shares + [t * scale for t in tail]
+
+
+def build_league_table(abs_margin_counts: List[float], league: str, source: str, pseudo_count: float = 0.5) -> Dict:
+    """Turn absolute-margin counts into key-number weights and half-point values
+
+    pseudo_count is add-k smoothing for margins a results sample never saw; the prior is
+    already a full distribution of percentage shares, so it is built with 0.
+    """
+    total = sum(abs_margin_counts)
+    pmf = [(c + pseudo_count) / (total + pseudo_count * len(abs_margin_counts)) for c in abs_margin_counts]
+
+    # Key-number weight = how much more often a margin happens than a smooth curve predicts
+    spread_sd = math.sqrt(sum(k * k * p for k, p in enumerate(pmf)))
+    smooth = [_normal_pdf(k, spread_sd) * (1 if k == 0 else 2) for k in range(len(pmf))]
+    smooth_total = sum(smooth)
+    low, high = KEY_WEIGHT_LIMITS
+    key_weights = [round(min(max(p / (s / smooth_total), low), high), 4) if k <= KEY_WEIGHT_MAX_MARGIN else 1.0
+                   for k, (p, s) in enumerate(zip(pmf, smooth))]
+
+    table = {
+        'source': source,
+        'sigma': RESIDUAL_SIGMA[league],
+        'abs_margin_pmf': [round(p, 6) for p in pmf],
+        'key_weights': key_weights,
+    }
+    # Value of a half point at each number: chance a game lined there lands on it exactly
+    table['half_point_values'] = [round(_margin_pmf_row(table, float(k))[k + MAX_MARGIN], 4) for k in range(31)]
+    return table
+
+
+def _weighted_row(table: Dict, center: float) -> List[float]:
+    sigma, weights = table['sigma'], table['key_weights']
+    row = [_normal_pdf(k - center, sigma) * weights[abs(k)] for k in range(-MAX_MARGIN, MAX_MARGIN + 1)]
+    norm = sum(row)
+    return [p / norm for p in row]
+
+
+def _row_mean(row: List[float]) -> float:
+    return sum((k - MAX_MARGIN) * p for k, p in enumerate(row))
+
+
+def _margin_pmf_row(table: Dict, model_margin: float) -> List[float]:
+    """P(final margin = k) for k in -MAX_MARGIN..MAX_MARGIN given the model's expected margin"""
+    # Key-number weights drag the mean toward small margins, so re-center
+    # the curve (secant steps) until the weighted row's mean is the model margin
+    lo_center, hi_center = model_margin, model_margin * 1.5 + 1
+    lo_error = _row_mean(_weighted_row(table, lo_center)) - model_margin
+    hi_error = _row_mean(_weighted_row(table, hi_center)) - model_margin
+    for _ in range(6):
+        if abs(hi_error) < 1e-3 or hi_error == lo_error:
+            break
+        next_center = hi_center - hi_error * (hi_center - lo_center) / (hi_error - lo_error)
+        lo_center, lo_error = hi_center, hi_error
+        hi_center = next_center
+        hi_error = _row_mean(_weighted_row(table, hi_center)) - model_margin
+    return _weighted_row(table, hi_center)
+
+
+def build_tables(results: Optional[List[Dict]] = None) -> Dict:
+    """Build tables for both leagues from results (league, home_score, away_score) or the prior"""
+    tables = {}
+    for league in ('NFL', 'CFB'):
+        margins = [abs(int(r['home_score']) - int(r['away_score'])) for r in results or [] if r['league'].upper() == league]
+        if margins:
+            counts = [0.0] * (MAX_MARGIN + 1)
+            for margin in margins:
+                counts[min(margin, MAX_MARGIN)] += 1
+            tables[league] = build_league_table(counts, league, f"{len(margins)} historical games")
+        else:
+            tables[league] = build_league_table(prior_abs_margin_counts(league), league, 'prior', pseudo_count=0.0)
+    return tables
+
+
+class MarginTables:
+    def __init__(self, tables: Dict):
+        self.tables = tables
+        self.pmf_rows = {}
+        self.cdf_rows = {}
+        # Expand each league into PMF/CDF rows on a half-point model-margin grid, once
+        for league, table in tables.items():
+            pmf_rows, cdf_rows = [], []
+            for step in range(-2 * MAX_MODEL_MARGIN, 2 * MAX_MODEL_MARGIN + 1):
+                pmf = _margin_pmf_row(table, step / 2)
+                cdf, running = [], 0.0
+                for p in pmf:
+                    running += p
+                    cdf.append(running)
+                pmf_rows.append(pmf)
+                cdf_rows.append(cdf)
+            self.pmf_rows[league] = pmf_rows
+            self.cdf_rows[league] = cdf_rows
+
+    def _row(self, model_margin: float) -> int:
+        step = round(model_margin * 2)
+        return min(max(step, -2 * MAX_MODEL_MARGIN), 2 * MAX_MODEL_MARGIN) + 2 * MAX_MODEL_MARGIN
+
+    def _league(self, league: str) -> str:
+        return league if league in self.tables else 'NFL'
+
+    def margin_above(self, league: str, model_margin: float, threshold: float) -> Dict:
+        """P(home margin > threshold) and P(margin == threshold) in O(1)"""
+        league = self._league(league)
+        row = self._row(model_margin)
+        pmf, cdf = self.pmf_rows[league][row], self.cdf_rows[league][row]
+
+        index = math.floor(threshold) + MAX_MARGIN
+        if index < 0:
+            return {'above': 1.0, 'exact': 0.0}
+        if index >= len(cdf):
+            return {'above': 0.0, 'exact': 0.0}
+        exact = pmf[index] if float(threshold).is_integer() else 0.0
+        return {'above': 1 - cdf[index], 'exact': exact}
+
+    def cover_probability(self, league: str, spread: float, model_margin: float) -> Dict:
+        """Home/away cover and push probabilities for a home spread and model home margin"""
+        # Home covers when margin + spread > 0
+        result = self.margin_above(league, model_margin, -spread)
+        home = result['above']
+        push = result['exact']
+        return {'home': home, 'away': 1 - home - push, 'push': push}
+
+    def win_probability(self, league: str, model_margin: float) -> Dict:
+        """Straight-up win probabilities, splitting ties evenly"""
+        result = self.margin_above(league, model_margin, 0)
+        home = result['above'] + result['exact'] / 2
+        return {'home': home, 'away': 1 - home}
+
+    def moneyline_value(self, league: str, model_margin: float, away_ml: int, home_ml: int) -> Dict:
+        """Model win probabilities against the moneyline prices"""
+        win = self.win_probability(league, model_margin)
+        away_edge = win['away'] - implied_probability(away_ml)
+        home_edge = win['home'] - implied_probability(home_ml)
+        value_side = None
+        if max(away_edge, home_edge) > 0:
+            value_side = 'home' if home_edge >= away_edge else 'away'
+        return {
+            'away_win_probability': round(win['away'], 4),
+            'home_win_probability': round(win['home'], 4),
+            'away_edge': round(away_edge, 4),
+            'home_edge': round(home_edge, 4),
+            'value_side': value_side
+        }
+
+    def teaser_cover_probability(self, league: str, spread: float, model_margin: float, side: str, points: float = 6) -> float:
+        """Chance a side covers once teased by `points`"""
+        teased_spread = spread + points if side == 'home' else spread - points
+        return self.cover_probability(league, teased_spread, model_margin)[side]
+
+    def half_point_value(self, league: str, number: int) -> float:
+        """Cover probability gained by buying a half point onto (or off) a number, e.g. +2.5 to +3"""
+        values = self.tables[self._league(league)]['half_point_values']
+        number = abs(int(number))
+        return values[number] if number < len(values) else 0.0
+
+
+def load_tables(path: str = TABLES_PATH) -> MarginTables:
+    """Margin tables, read and expanded once per process"""
+    global _tables
+    if _tables is None:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                tables = json.load(f)
+        else:
+            tables = build_tables()
+        _tables = MarginTables(tables)
+    return _tables
+
+
+def line_label(points: float) -> str:
+    """Format a spread for display, e.g. -3.5 / +7 / PK"""
+    if points == 0:
+        return "PK"
+    return f"{points:+g}"
+
+
+def confidence_from_probability(probability: float, floor: float = 50, cap: float = 95) -> float:
+    """Map a cover/win probability onto the 0-100 confidence scale the site displays"""
+    return min(max(50 + (probability - 0.5) * 200, floor), cap)
+
+
+def main():
+    """Rebuild data/margin_tables.json from results CSVs (or the prior when none given)"""
+    results = []
+    for path in sys.argv[1:]:
+        with open(path, newline='', encoding='utf-8') as f:
+            results.extend(csv.DictReader(f))
+
+    tables = build_tables(results)
+    os.makedirs(os.path.dirname(TABLES_PATH), exist_ok=True)
+    with open(TABLES_PATH, 'w', encoding='utf-8') as f:
+        json.dump(tables, f, separators=(',', ':'))
+
+    for league, table in tables.items():
+        print(f"{league}: built from {table['source']}, "
+              f"half point at 3 = {table['half_point_values'][3]:.3f}, at 7 = {table['half_point_values'][7]:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+PARALLEL GAME ANALYSIS
+Splits a slate into picklable per-game work units and analyzes them across a process pool
+Every unit carries its own seed, so results match the serial path for any worker count
+"""
+
+import hashlib
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional, Tuple
+
+# Below this many games the pool costs more to start than it saves
+MIN_PARALLEL_GAMES = 16
+
+_worker_updater = None
+
+
+def game_seed(base_seed: int, week: int, game: Dict) -> int:
+    """Stable per-game seed from the run seed, week and matchup"""
+    key = f"{base_seed}:{week}:{game['away_team']}@{game['home_team']}:{game.get('commence_time', '')}"
+    return int(hashlib.sha256(key.encode('utf-8')).hexdigest()[:16], 16)
+
+
+def make_work_units(games: List[Dict], totals: List[Optional[Dict]], week: int, base_seed: int) -> List[Tuple]:
+    """One (game, totals projection, seed) unit per game, in slate order"""
+    return [(game, projection, game_seed(base_seed, week, game)) for game, projection in zip(games, totals)]
+
+
+def _init_worker(updater: Any):
+    global _worker_updater
+    _worker_updater = updater
+
+
+def analyze_unit(updater: Any, unit: Tuple) -> Dict:
+    """Analyze one work unit with its own seeded random stream, leaving the global one alone"""
+    game, projection, seed = unit
+    return updater.generate_game_analysis(game, projection, random.Random(seed))
+
+
+def _analyze_in_worker(unit: Tuple) -> Dict:
+    return analyze_unit(_worker_updater, unit)
+
+
+def analyze_games(updater: Any, games: List[Dict], totals: List[Optional[Dict]], workers: int = 1,
+                  base_seed: int = 0) -> List[Dict]:
+    """Analyses for a slate, in input order, across `workers` processes
+
+    The updater is shipped to each worker once; work units go out in chunks.
+    Small slates, workers=1, or a pool that can't start run serially instead.
+    """
+    units = make_work_units(games, totals, updater.current_week, base_seed)
+
+    if workers > 1 and len(units) >= MIN_PARALLEL_GAMES:
+        chunksize = max(1, len(units) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(updater,)) as pool:
+                return list(pool.map(_analyze_in_worker, units, chunksize=chunksize))
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+            print(f"Process pool unavailable ({e}), analyzing serially")
+
+    return [analyze_unit(updater, unit) for unit in units]
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+PARLAY CORRELATION MODEL
+Joint cover/total outcomes from the totals engine's team score distributions,
+reduced to a lift per (market pair, spread bucket) so correlated legs price together
+Lift = P(both legs hit) / (P(leg A) x P(leg B)); 1.0 means independent
+"""
+
+import math
+from functools import lru_cache
+from typing import List, Dict, Tuple
+
+import totals_engine
+
+# Favorite's spread buckets (upper edges, key numbers) and the line used to represent each
+SPREAD_BUCKET_EDGES = [2.5, 6.5, 9.5, 13.5, 20.5]
+BUCKET_SPREADS = [1.5, 4.5, 8.5, 11.5, 16.5, 24.5]
+
+# Posted total the bucket lifts are measured at
+TYPICAL_TOTALS = {'NFL': 44.5, 'CFB': 55.5}
+
+SPREAD_SELECTIONS = ('favorite', 'underdog')
+TOTAL_SELECTIONS = ('over', 'under')
+
+
+def spread_bucket(spread: float) -> int:
+    """Bucket index for an absolute spread"""
+    spread = abs(spread)
+    for bucket, edge in enumerate(SPREAD_BUCKET_EDGES):
+        if spread <= edge:
+            return bucket
+    return len(SPREAD_BUCKET_EDGES)
+
+
+def joint_cover_total(favorite_mean: float, underdog_mean: float, spread: float, total: float, drives: int) -> Dict:
+    """Exact joint probabilities of (favorite covers, game goes over) from the two score PMFs"""
+    favorite_survival = totals_engine.points_survival(round(favorite_mean, 1), drives)
+    underdog_pmf = totals_engine.points_pmf(round(underdog_mean, 1), drives)
+
+    def favorite_above(x: float) -> float:
+        needed = math.floor(x)
+        if needed < 0:
+            return 1.0
+        return favorite_survival[needed] if needed <= totals_engine.MAX_POINTS else 0.0
+
+    cover = over = both = 0.0
+    for underdog_points, p_underdog in enumerate(underdog_pmf):
+        cover += p_underdog * favorite_above(underdog_points + spread)
+        over += p_underdog * favorite_above(total - underdog_points)
+        both += p_underdog * favorite_above(max(underdog_points + spread, total - underdog_points))
+    return {'cover': cover, 'over': over, 'both': both}
+
+
+@lru_cache(maxsize=None)
+def correlation_table(league: str) -> Dict[Tuple[str, str, int], float]:
+    """Lift for every (spread selection, total selection, spread bucket), built once per league"""
+    drives = totals_engine.DRIVES.get(league, 11)
+    total = TYPICAL_TOTALS.get(league, 44.5)
+    table = {}
+    for bucket, spread in enumerate(BUCKET_SPREADS):
+        joint = joint_cover_total((total + spread) / 2, (total - spread) / 2, spread, total, drives)
+        cover, over, both = joint['cover'], joint['over'], joint['both']
+        cells = {
+            ('favorite', 'over'): (both, cover * over),
+            ('favorite', 'under'): (cover - both, cover * (1 - over)),
+            ('underdog', 'over'): (over - both, (1 - cover) * over),
+            ('underdog', 'under'): (1 - cover - over + both, (1 - cover) * (1 - over)),
+        }
+        for (spread_selection, total_selection), (p_joint, p_independent) in cells.items():
+            table[(spread_selection, total_selection, bucket)] = round(p_joint / p_independent, 4)
+    return table
+
+
+def leg_correlation_key(leg: Dict) -> Tuple:
+    """What a leg contributes to a lookup: (league, game, market, selection, spread bucket)"""
+    return (leg.get('league', 'NFL'), leg['game_id'], leg['market'], leg['selection'], leg['spread_bucket'])
+
+
+def pair_lift(key_a: Tuple, key_b: Tuple) -> float:
+    """Lift for two legs from their correlation keys in O(1)
+
+    Legs in different games come from independent score distributions, so
+    cross-game pairs price at 1.0; two legs on the same market of one game
+    can't both be played.
+    """
+    league, game_a, market_a, selection_a, bucket = key_a
+    _, game_b, market_b, selection_b, _ = key_b
+    if game_a != game_b or market_a == market_b:
+        return 1.0
+    if market_a == 'spread':
+        return correlation_table(league)[(selection_a, selection_b, bucket)]
+    return correlation_table(league)[(selection_b, selection_a, bucket)]
+
+
+def parlay_lift(legs: List[Dict]) -> float:
+    """Combined lift over every pair of legs in a parlay"""
+    keys = [leg_correlation_key(leg) for leg in legs]
+    lift = 1.0
+    for i in range(len(keys)):
+        for j in range(i + 1, len(keys)):
+            lift *= pair_lift(keys[i], keys[j])
+    return lift
+
+
+def max_pair_lift(legs: List[Dict]) -> float:
+    """Largest lift any same-game pair among candidate legs can add (at least 1.0)"""
+    keys = [leg_correlation_key(leg) for leg in legs]
+    best = 1.0
+    by_game = {}
+    for key in keys:
+        by_game.setdefault(key[1], []).append(key)
+    for game_keys in by_game.values():
+        for i in range(len(game_keys)):
+            for j in range(i + 1, len(game_keys)):
+                best = max(best, pair_lift(game_keys[i], game_keys[j]))
+    return best
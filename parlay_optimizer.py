@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+PARLAY OPTIMIZER
+Branch-and-bound search for the highest expected value 2-6 leg parlay
+Legs come from analyzed games; expected value uses the model's cover probabilities,
+with same-game legs priced jointly through the correlation model
+"""
+
+from typing import List, Dict, Optional
+
+import parlay_correlation
+
+DEFAULT_LEG_ODDS = -110
+
+# Leg probabilities are capped here before pricing: no side covers 90% of the time, so reads above
+# this are model error, and compounding a few of them turned ordinary slates into +200% EV longshots
+MAX_LEG_PROBABILITY = 0.60
+
+
+def american_to_decimal(american_odds: int) -> float:
+    """Convert American odds to decimal"""
+    if american_odds > 0:
+        return (american_odds / 100) + 1
+    return (100 / abs(american_odds)) + 1
+
+
+def decimal_to_american(decimal_odds: float) -> int:
+    """Convert decimal odds to American"""
+    if decimal_odds >= 2:
+        return int((decimal_odds - 1) * 100)
+    return int(-100 / (decimal_odds - 1))
+
+
+def price_parlays(leg_odds: List[List[int]], leg_probabilities: Optional[List[List[float]]] = None,
+                  lifts: Optional[List[float]] = None) -> Dict[str, List]:
+    """Price many candidate parlays in one call
+
+    leg_odds is a 2-D array with one row of American prices per parlay (rows
+    may differ in length). With a matching leg_probabilities array the model
+    hit rate and expected value per unit staked come back too; lifts (one per
+    parlay, from the correlation model) turn the product of marginals into a
+    joint hit rate.
+    """
+    decimal_cache = {}
+    decimals, payouts, implied, american = [], [], [], []
+    for row in leg_odds:
+        decimal = 1.0
+        for odds in row:
+            leg_decimal = decimal_cache.get(odds)
+            if leg_decimal is None:
+                leg_decimal = decimal_cache[odds] = american_to_decimal(odds)
+            decimal *= leg_decimal
+        decimals.append(decimal)
+        payouts.append(decimal - 1)
+        implied.append(1 / decimal)
+        american.append(decimal_to_american(decimal))
+
+    priced = {
+        'decimal_odds': decimals,
+        'american_odds': american,
+        'payout': payouts,
+        'implied_probability': implied,
+    }
+
+    if leg_probabilities is not None:
+        model_probabilities = []
+        for row in leg_probabilities:
+            probability = 1.0
+            for leg_probability in row:
+                probability *= leg_probability
+            model_probabilities.append(probability)
+        if lifts is not None:
+            model_probabilities = [min(p * lift, 1.0) for p, lift in zip(model_probabilities, lifts)]
+        priced['model_probability'] = model_probabilities
+        priced['expected_value'] = [p * d - 1 for p, d in zip(model_probabilities, decimals)]
+
+    return priced
+
+
+def build_legs(games: List[Dict], league: str = 'NFL') -> List[Dict]:
+    """Candidate legs per analyzed game: the spread pick plus the model's side of the total"""
+    legs = []
+    for game in games:
+        info, pick = game['game_info'], game['pick']
+        game_id = f"{info['away_team']} @ {info['home_team']}"
+        bucket = parlay_correlation.spread_bucket(info['spread'])
+        home_favorite = info['spread'] < 0
+
+        probability = min(pick.get('cover_probability', pick['confidence'] / 100), MAX_LEG_PROBABILITY)
+        odds = pick.get('odds', DEFAULT_LEG_ODDS)
+        legs.append({
+            'game_id': game_id,
+            'league': league,
+            'market': 'spread',
+            'selection': 'favorite' if (pick.get('side') == 'home') == home_favorite else 'underdog',
+            'spread_bucket': bucket,
+            'label': f"{pick['team']} {pick['line']}",
+            'probability': probability,
+            'odds': odds,
+            'decimal_odds': american_to_decimal(odds),
+            'analysis': game
+        })
+
+        score = game.get('predicted_score', {})
+        if 'p_over' not in score:
+            continue
+        selection = 'over' if score['p_over'] >= score['p_under'] else 'under'
+        odds = info.get(f'{selection}_odds', DEFAULT_LEG_ODDS)
+        legs.append({
+            'game_id': game_id,
+            'league': league,
+            'market': 'total',
+            'selection': selection,
+            'spread_bucket': bucket,
+            'label': f"{selection.upper()} {info['total']}",
+            'probability': min(score[f'p_{selection}'], MAX_LEG_PROBABILITY),
+            'odds': odds,
+            'decimal_odds': american_to_decimal(odds),
+            'analysis': game
+        })
+    return legs
+
+
+def optimize_parlay(legs: List[Dict], min_legs: int = 2, max_legs: int = 6, max_same_game: int = 1) -> Optional[Dict]:
+    """Best positive expected value parlay of min_legs..max_legs legs, or None when no ticket is +EV
+
+    One leg per game and market, and at most max_same_game games may put both their
+    spread and total on the ticket.
+
+    A parlay's return per unit is the product of each leg's probability x decimal
+    odds times the correlation lift between same-game legs, so legs are searched
+    in descending order of that ratio and any branch whose optimistic bound
+    (current product x the best remaining ratios x the largest lift each added
+    leg could bring) can't beat the incumbent is pruned. The incumbent starts at a
+    return of 1.0, i.e. break-even, so only tickets that beat it are found.
+    """
+    candidates = sorted(legs, key=lambda leg: leg['probability'] * leg['decimal_odds'], reverse=True)
+    ratios = [leg['probability'] * leg['decimal_odds'] for leg in candidates]
+    keys = [parlay_correlation.leg_correlation_key(leg) for leg in candidates]
+    count = len(candidates)
+    if count < min_legs:
+        return None
+
+    # Each game offers one spread and one total leg, so an added leg pairs with at most one chosen leg
+    max_lift = parlay_correlation.max_pair_lift(candidates)
+    best = {'ratio': 1.0, 'indices': None}
+    nodes = 0
+
+    def search(start: int, chosen: List[int], taken: Dict, ratio: float, stacked: int):
+        nonlocal nodes
+        nodes += 1
+        if len(chosen) >= min_legs and ratio > best['ratio']:
+            best['ratio'] = ratio
+            best['indices'] = list(chosen)
+        if len(chosen) == max_legs:
+            return
+
+        for i in range(start, count):
+            # Optimistic bound: extend with the best remaining ratios (only those that help)
+            bound = ratio * ratios[i] * max_lift
+            for j in range(i + 1, min(i + max_legs - len(chosen), count)):
+                if ratios[j] * max_lift <= 1:
+                    break
+                bound *= ratios[j] * max_lift
+            if bound <= best['ratio']:
+                # Ratios only shrink from here, so no later start can do better either
+                break
+            game_id, market = keys[i][1], keys[i][2]
+            if (game_id, market) in taken:
+                continue
+            partner = taken.get((game_id, 'total' if market == 'spread' else 'spread'))
+            if partner is not None and stacked >= max_same_game:
+                continue
+            lift = 1.0 if partner is None else parlay_correlation.pair_lift(keys[i], keys[partner])
+            chosen.append(i)
+            taken[(game_id, market)] = i
+            search(i + 1, chosen, taken, ratio * ratios[i] * lift, stacked + (partner is not None))
+            del taken[(game_id, market)]
+            chosen.pop()
+
+    search(0, [], {}, 1.0, 0)
+    if best['indices'] is None:
+        return None
+
+    chosen_legs = [candidates[i] for i in best['indices']]
+    lift = parlay_correlation.parlay_lift(chosen_legs)
+    priced = price_parlays([[leg['odds'] for leg in chosen_legs]], [[leg['probability'] for leg in chosen_legs]], [lift])
+
+    return {
+        'legs': chosen_legs,
+        'probability': priced['model_probability'][0],
+        'independent_probability': priced['model_probability'][0] / lift,
+        'correlation_lift': lift,
+        'decimal_odds': priced['decimal_odds'][0],
+        'american_odds': priced['american_odds'][0],
+        'expected_value': priced['expected_value'][0],
+        'nodes': nodes
+    }
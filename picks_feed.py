@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+PICKS FEED
+Compact per-league, per-week JSON that the static shell page (picks.html) renders in the browser
+data/weekly-picks.json is the small index it loads first; each league's file loads on demand,
+so a data change rewrites only these files and never the page itself
+"""
+
+import gzip
+import json
+import os
+from typing import List, Dict, Any, Optional
+
+FEED_DIR = 'data/picks'
+INDEX_PATH = 'data/weekly-picks.json'
+
+ANALYSIS_SECTIONS = ('the_line', 'the_matchup', 'the_angle', 'the_bottom_line')
+RANK_FIELDS = ('offense_rank', 'defense_rank', 'rush_offense', 'rush_defense', 'pass_offense', 'pass_defense')
+
+
+def feed_path(league: str, week: int, feed_dir: str = FEED_DIR) -> str:
+    return os.path.join(feed_dir, f"{league.lower()}-week-{week}.json")
+
+
+def compact_stats(stats: Dict) -> Dict:
+    """Rankings and scoring for one team, when the updater tracks them"""
+    compact = {field: stats[field] for field in RANK_FIELDS if field in stats}
+    for field in ('points_for', 'points_against'):
+        if field in stats:
+            compact[field] = round(stats[field], 1)
+    return compact
+
+
+def compact_game(game: Dict) -> Dict:
+    """Everything a game card shows, and nothing it doesn't"""
+    info, pick, score = game['game_info'], game['pick'], game['predicted_score']
+    compact = {
+        'id': info.get('event_id') or f"{info['away_team']} @ {info['home_team']}",
+        'away': info['away_team'],
+        'home': info['home_team'],
+        'time': info['time'],
+        'venue': info['venue'],
+        'spread': info['spread'],
+        'total': info['total'],
+        'pick': {
+            'team': pick['team'],
+            'line': pick['line'],
+            'odds': pick['odds'],
+            'confidence': round(pick['confidence'], 1),
+            'cover_probability': pick['cover_probability']
+        },
+        'score': {
+            'away': score['away_score'],
+            'home': score['home_score'],
+            'lean': score.get('total_lean', 'CLOSE'),
+            'p_over': round(score['p_over'], 3)
+        },
+        'analysis': {section: game['analysis'][section] for section in ANALYSIS_SECTIONS}
+    }
+    if 'units' in pick:
+        compact['pick']['units'] = pick['units']
+    if 'away_record' in info:
+        compact['records'] = {'away': info['away_record'], 'home': info['home_record']}
+    if 'away_stats' in info:
+        compact['stats'] = {'away': compact_stats(info['away_stats']), 'home': compact_stats(info['home_stats'])}
+    if game.get('data_basis'):
+        compact['basis'] = game['data_basis']
+    return compact
+
+
+def compact_prop(prop: Dict) -> Dict:
+    return {
+        'player': prop['prop']['player'],
+        'market': prop['prop']['market'],
+        'pick': prop['pick'],
+        'odds': int(prop['odds']),
+        'confidence': round(float(prop['confidence']), 1),
+        'reasoning': prop['reasoning']
+    }
+
+
+def league_feed(league: str, week: int, season: int, games: List[Dict], parlay: Dict,
+                props: Optional[List[Dict]] = None) -> Dict:
+    """One league's week: picks, the parlay with its round robins and teasers, and props
+
+    No timestamp here (the index carries it), so an unchanged slate writes identical bytes.
+    """
+    feed = {
+        'meta': {'league': league, 'week': week, 'season': season},
+        'games': [compact_game(game) for game in games],
+        'parlay': parlay
+    }
+    if props:
+        feed['props'] = [compact_prop(prop) for prop in props]
+    return feed
+
+
+def write_json(path: str, payload: Any, precompress: bool = False, indent: Optional[int] = None) -> bool:
+    """Atomically write payload as JSON (plus a .gz twin when precompress), skipping unchanged files
+
+    Without precompress a .gz twin left by an earlier run is deleted, so it can't be served stale.
+    Returns whether anything was rewritten.
+    """
+    separators = None if indent else (',', ':')
+    data = json.dumps(payload, indent=indent, separators=separators, ensure_ascii=False).encode('utf-8')
+
+    targets = [(path, data)]
+    if precompress:
+        # mtime=0 keeps the .gz bytes stable for unchanged data
+        targets.append((path + '.gz', gzip.compress(data, compresslevel=9, mtime=0)))
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    changed = False
+    if not precompress and os.path.exists(path + '.gz'):
+        os.remove(path + '.gz')
+        changed = True
+    for target, content in targets:
+        if os.path.exists(target):
+            with open(target, 'rb') as f:
+                if f.read() == content:
+                    continue
+        temp_path = target + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, target)
+        changed = True
+    return changed
+
+
+def write_week(meta: Dict, leagues: Dict[str, Dict], summary: List[Dict], precompress: bool = False, feed_dir: str = FEED_DIR, index_path: str = INDEX_PATH) -> Dict[str, bool]:
+    """Write each league's feed and the index that points at them
+
+    leagues maps league name to its league_feed(). Returns which files changed.
+    """
+    feeds, changed = {}, {}
+    for league, feed in leagues.items():
+        path = feed_path(league, meta['week'], feed_dir)
+        changed[path] = write_json(path, feed, precompress)
+        feeds[league.lower()] = {'path': path.replace(os.sep, '/'), 'games': len(feed['games'])}
+
+    index = {'meta': meta, 'feeds': feeds, 'games': summary}
+    changed[index_path] = write_json(index_path, index, indent=2)
+    return changed
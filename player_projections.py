@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+PLAYER PROJECTION STORE
+Exponentially weighted per-player stat averages built from weekly box scores
+Box scores live in data/box_scores/<league>/week-<N>.json as a list of player stat lines
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import List, Dict, Optional
+
+STAT_KEYS = ['pass_yds', 'pass_tds', 'rush_yds', 'receptions']
+
+# Odds API prop market -> box score stat it settles on
+MARKET_STATS = {
+    'player_pass_yds': 'pass_yds',
+    'player_pass_tds': 'pass_tds',
+    'player_rush_yds': 'rush_yds',
+    'player_receptions': 'receptions',
+}
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+
+@lru_cache(maxsize=65536)
+def normalize_player_name(name: str) -> str:
+    """Normalize a player name so 'D.J. Moore Jr.' and 'DJ Moore' share a key"""
+    words = re.sub(r"[^a-z0-9 ]", "", name.lower().replace('-', ' ')).split()
+    while len(words) > 1 and words[-1] in NAME_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+class PlayerProjectionStore:
+    def __init__(self, path: str = 'data/player_projections.json', alpha: float = 0.35):
+        self.path = path
+        self.alpha = alpha
+        self.players = {'nfl': {}, 'cfb': {}}
+        self.applied_files = []
+        self._applied = set()
+
+    @classmethod
+    def load(cls, path: str = 'data/player_projections.json', alpha: float = 0.35) -> 'PlayerProjectionStore':
+        """Load a saved store, or start an empty one"""
+        store = cls(path, alpha)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            store.alpha = saved.get('alpha', alpha)
+            store.players.update(saved.get('players', {}))
+            store.applied_files = saved.get('applied_files', [])
+            store._applied = set(store.applied_files)
+        return store
+
+    def save(self):
+        """Write the store back to disk"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'alpha': self.alpha, 'applied_files': self.applied_files, 'players': self.players}, f, separators=(',', ':'))
+
+    def update_player(self, league: str, player: str, stats: Dict):
+        """Fold one player-game into the rolling averages in O(1)"""
+        key = normalize_player_name(player)
+        entry = self.players.setdefault(league.lower(), {}).get(key)
+        if entry is None:
+            entry = self.players[league.lower()][key] = {'player': player, 'games': 0}
+
+        for stat in STAT_KEYS:
+            value = stats.get(stat)
+            if value is None:
+                continue
+            previous = entry.get(stat)
+            entry[stat] = float(value) if previous is None else previous + self.alpha * (value - previous)
+        entry['games'] += 1
+
+    def ingest_box_score_file(self, path: str, league: str) -> int:
+        """Apply a weekly box-score file once, returning the number of player-games added"""
+        file_key = f"{league.lower()}/{os.path.basename(path)}"
+        if file_key in self._applied:
+            return 0
+
+        with open(path, 'r', encoding='utf-8') as f:
+            stat_lines = json.load(f)
+
+        for line in stat_lines:
+            self.update_player(league, line['player'], line)
+
+        self.applied_files.append(file_key)
+        self._applied.add(file_key)
+        return len(stat_lines)
+
+    def update_from_directory(self, box_score_dir: str = 'data/box_scores') -> int:
+        """Ingest any weekly box-score files that haven't been applied yet, oldest first"""
+        added = 0
+        for league in ('nfl', 'cfb'):
+            league_dir = os.path.join(box_score_dir, league)
+            if not os.path.isdir(league_dir):
+                continue
+            week_files = sorted(
+                (name for name in os.listdir(league_dir) if name.endswith('.json')),
+                key=lambda name: int(re.sub(r"\D", "", name) or 0)
+            )
+            for name in week_files:
+                added += self.ingest_box_score_file(os.path.join(league_dir, name), league)
+        return added
+
+    def lookup(self, player: str, league: str) -> Optional[Dict]:
+        """Rolling averages for a player, or None if we have never seen them"""
+        return self.players.get(league.lower(), {}).get(normalize_player_name(player))
+
+    def project(self, player: str, league: str, market: str) -> Optional[float]:
+        """Projected stat for a prop market, or None without history"""
+        entry = self.lookup(player, league)
+        stat = MARKET_STATS.get(market)
+        if entry is None or stat is None:
+            return None
+        return entry.get(stat)
+
+    def project_many(self, players: List[str], league: str, markets: List[str]) -> List[Optional[float]]:
+        """Projection column for a batch of props from one league"""
+        league_players = self.players.get(league.lower(), {})
+        projections = []
+        for player, market in zip(players, markets):
+            entry = league_players.get(normalize_player_name(player))
+            stat = MARKET_STATS.get(market)
+            projections.append(entry.get(stat) if entry is not None and stat is not None else None)
+        return projections
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+CARD SEARCH INDEX
+Prebuilt term -> card lookup for the page's filter bar: team names, aliases, conference or
+division, league, pick side and confidence bucket, so filtering a 100+ card week is a few
+array lookups in the browser instead of a scan over every card's text
+"""
+
+import json
+import re
+from typing import List, Dict
+
+INDEX_PATH = 'data/search-index.json'
+
+NFL_DIVISIONS = {
+    'AFC East': ['Buffalo Bills', 'Miami Dolphins', 'New England Patriots', 'New York Jets'],
+    'AFC North': ['Baltimore Ravens', 'Cincinnati Bengals', 'Cleveland Browns', 'Pittsburgh Steelers'],
+    'AFC South': ['Houston Texans', 'Indianapolis Colts', 'Jacksonville Jaguars', 'Tennessee Titans'],
+    'AFC West': ['Denver Broncos', 'Kansas City Chiefs', 'Las Vegas Raiders', 'Los Angeles Chargers'],
+    'NFC East': ['Dallas Cowboys', 'New York Giants', 'Philadelphia Eagles', 'Washington Commanders'],
+    'NFC North': ['Chicago Bears', 'Detroit Lions', 'Green Bay Packers', 'Minnesota Vikings'],
+    'NFC South': ['Atlanta Falcons', 'Carolina Panthers', 'New Orleans Saints', 'Tampa Bay Buccaneers'],
+    'NFC West': ['Arizona Cardinals', 'Los Angeles Rams', 'San Francisco 49ers', 'Seattle Seahawks']
+}
+
+# 2025 Power 4 alignment, under the Odds API's team names
+CFB_CONFERENCES = {
+    'SEC': ['Alabama Crimson Tide', 'Arkansas Razorbacks', 'Auburn Tigers', 'Florida Gators', 'Georgia Bulldogs',
+            'Kentucky Wildcats', 'LSU Tigers', 'Mississippi State Bulldogs', 'Missouri Tigers', 'Oklahoma Sooners',
+            'Ole Miss Rebels', 'South Carolina Gamecocks', 'Tennessee Volunteers', 'Texas Longhorns',
+            'Texas A&M Aggies', 'Vanderbilt Commodores'],
+    'Big Ten': ['Illinois Fighting Illini', 'Indiana Hoosiers', 'Iowa Hawkeyes', 'Maryland Terrapins',
+                'Michigan Wolverines', 'Michigan State Spartans', 'Minnesota Golden Gophers', 'Nebraska Cornhuskers',
+                'Northwestern Wildcats', 'Ohio State Buckeyes', 'Oregon Ducks', 'Penn State Nittany Lions',
+                'Purdue Boilermakers', 'Rutgers Scarlet Knights', 'UCLA Bruins', 'USC Trojans', 'Washington Huskies',
+                'Wisconsin Badgers'],
+    'ACC': ['Boston College Eagles', 'California Golden Bears', 'Clemson Tigers', 'Duke Blue Devils',
+            'Florida State Seminoles', 'Georgia Tech Yellow Jackets', 'Louisville Cardinals', 'Miami Hurricanes',
+            'NC State Wolfpack', 'North Carolina Tar Heels', 'Pittsburgh Panthers', 'SMU Mustangs', 'Stanford Cardinal',
+            'Syracuse Orange', 'Virginia Cavaliers', 'Virginia Tech Hokies', 'Wake Forest Demon Deacons'],
+    'Big 12': ['Arizona Wildcats', 'Arizona State Sun Devils', 'Baylor Bears', 'BYU Cougars', 'Cincinnati Bearcats',
+               'Colorado Buffaloes', 'Houston Cougars', 'Iowa State Cyclones', 'Kansas Jayhawks', 'Kansas State Wildcats',
+               'Oklahoma State Cowboys', 'TCU Horned Frogs', 'Texas Tech Red Raiders', 'UCF Knights', 'Utah Utes',
+               'West Virginia Mountaineers'],
+    'Independent': ['Notre Dame Fighting Irish']
+}
+
+TEAM_ALIASES = {
+    'Arizona Cardinals': ('ari',), 'Atlanta Falcons': ('atl',), 'Baltimore Ravens': ('bal',), 'Buffalo Bills': ('buf',),
+    'Carolina Panthers': ('car',), 'Chicago Bears': ('chi',), 'Cincinnati Bengals': ('cin',), 'Cleveland Browns': ('cle',),
+    'Dallas Cowboys': ('dal',), 'Denver Broncos': ('den',), 'Detroit Lions': ('det',), 'Green Bay Packers': ('gb',),
+    'Houston Texans': ('hou',), 'Indianapolis Colts': ('ind',), 'Jacksonville Jaguars': ('jax',),
+    'Kansas City Chiefs': ('kc',), 'Las Vegas Raiders': ('lv',), 'Los Angeles Chargers': ('lac',),
+    'Los Angeles Rams': ('lar',), 'Miami Dolphins': ('mia',), 'Minnesota Vikings': ('min',),
+    'New England Patriots': ('ne', 'pats'), 'New Orleans Saints': ('no',), 'New York Giants': ('nyg',),
+    'New York Jets': ('nyj',), 'Philadelphia Eagles': ('phi',), 'Pittsburgh Steelers': ('pit',),
+    'San Francisco 49ers': ('sf', 'niners'), 'Seattle Seahawks': ('sea',), 'Tampa Bay Buccaneers': ('tb', 'bucs'),
+    'Tennessee Titans': ('ten',), 'Washington Commanders': ('was', 'wsh'),
+    'Alabama Crimson Tide': ('bama',), 'Georgia Bulldogs': ('uga',), 'Ohio State Buckeyes': ('osu',),
+    'Michigan Wolverines': ('um',), 'Florida State Seminoles': ('fsu',), 'Texas A&M Aggies': ('tamu',),
+    'Penn State Nittany Lions': ('psu',), 'North Carolina Tar Heels': ('unc',), 'Ole Miss Rebels': ('mississippi',),
+    'Notre Dame Fighting Irish': ('nd', 'irish')
+}
+
+TEAM_GROUPS = {team: group for groups in (NFL_DIVISIONS, CFB_CONFERENCES) for group, teams in groups.items() for team in teams}
+
+# (bucket, lowest confidence in it), highest first
+CONFIDENCE_BUCKETS = (('high', 75), ('medium', 60), ('low', 0))
+SIDES = ('favorite', 'underdog', 'home', 'away')
+
+# The page tokenizes queries with the same pattern
+TOKEN = re.compile(r'[a-z0-9&]+')
+
+
+def tokens(text: str) -> List[str]:
+    return TOKEN.findall(text.lower())
+
+
+def card_id(league: str, position: int) -> str:
+    """Id of a league's n-th game card; the page's element is card-<id>"""
+    return f"{league.lower()}-{position}"
+
+
+def confidence_bucket(confidence: float) -> str:
+    for bucket, floor in CONFIDENCE_BUCKETS:
+        if confidence >= floor:
+            return bucket
+    return CONFIDENCE_BUCKETS[-1][0]
+
+
+def card_terms(league: str, game: Dict) -> set:
+    """Every search term a game card answers to"""
+    info = game['game_info']
+    terms = set(tokens(league))
+    for team in (info['away_team'], info['home_team']):
+        terms.update(tokens(team))
+        terms.update(tokens(TEAM_GROUPS.get(team, '')))
+        for alias in TEAM_ALIASES.get(team, ()):
+            terms.update(tokens(alias))
+    return terms
+
+
+def card_facets(game: Dict) -> Dict[str, List[str]]:
+    """Confidence bucket and pick side(s) of a game card"""
+    pick, spread = game['pick'], game['game_info']['spread']
+    side = pick.get('side') or ('home' if pick['team'] == game['game_info']['home_team'] else 'away')
+    sides = [side]
+    # spread is the home line: negative when home is favored
+    pick_spread = spread if side == 'home' else -spread
+    if pick_spread:
+        sides.append('favorite' if pick_spread < 0 else 'underdog')
+    return {'confidence': [confidence_bucket(pick['confidence'])], 'side': sides}
+
+
+def build_index(leagues: Dict[str, List[Dict]], batch_size: int) -> Dict:
+    """Index over every league's cards, in page order
+
+    terms are sorted so the page can prefix-match a query word with a binary search;
+    postings[i] and the facet lists hold positions in cards.
+    """
+    cards, postings = [], {}
+    facets = {'confidence': {bucket: [] for bucket, _ in CONFIDENCE_BUCKETS}, 'side': {side: [] for side in SIDES}}
+    for league, games in leagues.items():
+        for position, game in enumerate(games):
+            card = len(cards)
+            cards.append(card_id(league, position))
+            for term in card_terms(league, game):
+                postings.setdefault(term, []).append(card)
+            for facet, values in card_facets(game).items():
+                for value in values:
+                    facets[facet][value].append(card)
+
+    terms = sorted(postings)
+    return {
+        'batch_size': batch_size,
+        'cards': cards,
+        'terms': terms,
+        'postings': [postings[term] for term in terms],
+        'facets': facets
+    }
+
+
+def script_tag(index: Dict) -> str:
+    """The index inlined as a JSON data block"""
+    payload = json.dumps(index, separators=(',', ':')).replace('</', '<\\/')
+    return f'<script type="application/json" id="search-index">{payload}</script>'
+
+
+def filter_bar() -> str:
+    """Query box and facet selects above the league tabs"""
+    confidence = ''.join(f'<option value="{bucket}">{bucket.title()} ({floor}%+)</option>' for bucket, floor in CONFIDENCE_BUCKETS[:-1])
+    confidence += f'<option value="{CONFIDENCE_BUCKETS[-1][0]}">{CONFIDENCE_BUCKETS[-1][0].title()}</option>'
+    sides = ''.join(f'<option value="{side}">{side.title()}s</option>' if side in ('favorite', 'underdog')
+                    else f'<option value="{side}">{side.title()} team</option>' for side in SIDES)
+    return f"""
+        <div class="flex flex-col md:flex-row gap-3 mb-4">
+            <input id="filter-query" type="search" placeholder="Filter by team, alias or conference (KC, Bama, SEC, AFC West)" aria-label="Filter picks" autocomplete="off" class="flex-1 py-2 px-4 rounded-md bg-slate-800 border border-slate-700 text-white">
+            <select data-filter-facet="confidence" aria-label="Confidence" class="py-2 px-4 rounded-md bg-slate-800 border border-slate-700 text-gray-300">
+                <option value="">Any confidence</option>{confidence}
+            </select>
+            <select data-filter-facet="side" aria-label="Pick side" class="py-2 px-4 rounded-md bg-slate-800 border border-slate-700 text-gray-300">
+                <option value="">Any side</option>{sides}
+            </select>
+        </div>
+        <p id="filter-status" class="text-sm text-gray-400 mb-4" hidden></p>"""
+
+
+# Runs after the page's renderLeague(); re-applies itself on the 'cards-rendered' event it fires
+FILTER_SCRIPT = """
+        (function() {
+            const index = JSON.parse(document.getElementById('search-index').textContent);
+            const query = document.getElementById('filter-query');
+            const selects = Array.from(document.querySelectorAll('[data-filter-facet]'));
+            const status = document.getElementById('filter-status');
+            let revealing = false;
+
+            // Cards for every term starting with the word: binary search to the first, then walk
+            function prefixMatches(word) {
+                let low = 0, high = index.terms.length;
+                while (low < high) {
+                    const mid = (low + high) >> 1;
+                    if (index.terms[mid] < word) low = mid + 1; else high = mid;
+                }
+                const cards = new Set();
+                for (let i = low; i < index.terms.length && index.terms[i].startsWith(word); i++) {
+                    index.postings[i].forEach(card => cards.add(card));
+                }
+                return cards;
+            }
+
+            function narrow(matches, cards) {
+                return matches === null ? cards : new Set([...matches].filter(card => cards.has(card)));
+            }
+
+            // null when no filter is set
+            function matchingCards() {
+                let matches = null;
+                (query.value.toLowerCase().match(/[a-z0-9&]+/g) || []).forEach(word => {
+                    matches = narrow(matches, prefixMatches(word));
+                });
+                selects.forEach(select => {
+                    if (select.value) matches = narrow(matches, new Set(index.facets[select.dataset.filterFacet][select.value] || []));
+                });
+                return matches;
+            }
+
+            // Render the league and the card batch a match is still waiting in
+            function reveal(id) {
+                const [league, position] = id.split('-');
+                const content = document.getElementById(league + '-content');
+                renderLeague(content);
+                const batch = content.querySelector('template[data-card-batch="' + Math.floor(position / index.batch_size) + '"]');
+                if (batch) batch.replaceWith(batch.content);
+            }
+
+            function applyFilter() {
+                const matches = matchingCards();
+                if (matches !== null) {
+                    revealing = true;
+                    matches.forEach(card => {
+                        if (!document.getElementById('card-' + index.cards[card])) reveal(index.cards[card]);
+                    });
+                    revealing = false;
+                }
+
+                const counts = {};
+                index.cards.forEach((id, card) => {
+                    const shown = matches === null || matches.has(card);
+                    const element = document.getElementById('card-' + id);
+                    if (element) element.hidden = !shown;
+                    if (shown) {
+                        const league = id.split('-')[0].toUpperCase();
+                        counts[league] = (counts[league] || 0) + 1;
+                    }
+                });
+                status.hidden = matches === null;
+                status.textContent = matches === null ? '' : matches.size + ' of ' + index.cards.length + ' picks match' +
+                    Object.entries(counts).map(([league, count]) => ' • ' + league + ' ' + count).join('');
+            }
+
+            query.addEventListener('input', applyFilter);
+            selects.forEach(select => select.addEventListener('change', applyFilter));
+            document.addEventListener('cards-rendered', () => {
+                if (!revealing) applyFilter();
+            });
+        })();
+"""
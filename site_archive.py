@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+WEEKLY PICKS ARCHIVE
+Freezes each finished week's page into archive/<season>/week-<N>.html the first time a run
+for a later week replaces index.html, and keeps a small archive/index.html listing them
+A frozen page is never rewritten, so vercel.json can serve it with an immutable cache header
+"""
+
+import os
+import re
+import shutil
+from typing import List, Tuple, Optional
+
+import html_minify
+import html_writer
+
+ARCHIVE_DIR = 'archive'
+INDEX_PATH = os.path.join(ARCHIVE_DIR, 'index.html')
+
+# Every generated page carries <meta name="picks-week" content="<season>-<week>">
+PAGE_WEEK = re.compile(r'<meta name="picks-week" content="(\d+)-(\d+)"')
+FROZEN_PAGE = re.compile(r'^week-(\d+)\.html$')
+
+
+def week_path(season: int, week: int, archive_dir: str = ARCHIVE_DIR) -> str:
+    return os.path.join(archive_dir, str(season), f"week-{week}.html")
+
+
+def page_week(path: str) -> Optional[Tuple[int, int]]:
+    """(season, week) a generated page was built for, read from its <head>"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        match = PAGE_WEEK.search(f.read(4096))
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def freeze_previous_week(page_path: str, season: int, week: int, archive_dir: str = ARCHIVE_DIR) -> Optional[str]:
+    """Archive the page about to be replaced if it belongs to an earlier week
+
+    Called before index.html is rewritten. Returns the archived path, or None when the
+    page is this week's (or unmarked) or that week is already archived.
+    """
+    built_for = page_week(page_path)
+    if built_for is None or built_for == (season, week):
+        return None
+    target = week_path(*built_for, archive_dir)
+    if os.path.exists(target):
+        return None
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = target + '.tmp'
+    shutil.copyfile(page_path, temp_path)
+    os.replace(temp_path, target)
+    html_minify.write_precompressed(target)
+    return target
+
+
+def archived_weeks(archive_dir: str = ARCHIVE_DIR) -> List[Tuple[int, int, str]]:
+    """(season, week, path) for every frozen page, newest first"""
+    weeks = []
+    if not os.path.isdir(archive_dir):
+        return weeks
+    for season in os.listdir(archive_dir):
+        season_dir = os.path.join(archive_dir, season)
+        if not (season.isdigit() and os.path.isdir(season_dir)):
+            continue
+        for name in os.listdir(season_dir):
+            match = FROZEN_PAGE.match(name)
+            if match:
+                weeks.append((int(season), int(match.group(1)), os.path.join(season_dir, name)))
+    return sorted(weeks, reverse=True)
+
+
+def render_index(season: int, week: int, stylesheet_href: str, weeks: List[Tuple[int, int, str]]) -> str:
+    """The archive listing: this week's live page, then every frozen week"""
+    links = f"""
+            <a href="/" class="block p-4 mb-4 bg-green-500/10 border border-green-500/30 rounded-lg">
+                <span class="font-bold text-green-400">Week {week} • Season {season}</span>
+                <span class="text-sm text-gray-400">(this week, live)</span>
+            </a>"""
+    for archived_season, archived_week, path in weeks:
+        href = '/' + path.replace(os.sep, '/')
+        links += f"""
+            <a href="{href}" class="block p-4 mb-4 bg-slate-800/50 border border-slate-700 rounded-lg text-gray-300 hover:text-white">
+                Week {archived_week} • Season {archived_season}
+            </a>"""
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Picks Archive | NFL & CFB Analysis</title>
+    <link rel="stylesheet" href="{stylesheet_href}">
+</head>
+<body class="bg-gradient-to-br from-slate-900 via-slate-800 to-slate-900 text-white min-h-screen">
+    <div class="max-w-6xl mx-auto px-6 py-6">
+        <h1 class="text-3xl font-bold text-green-400 mb-6">Picks Archive</h1>
+        <nav>{links}
+        </nav>
+    </div>
+</body>
+</html>"""
+
+
+def write_index(season: int, week: int, stylesheet_href: str, archive_dir: str = ARCHIVE_DIR) -> int:
+    """Rewrite archive/index.html; returns the number of frozen weeks it lists"""
+    weeks = archived_weeks(archive_dir)
+    page = render_index(season, week, stylesheet_href, weeks)
+    os.makedirs(archive_dir, exist_ok=True)
+    html_writer.write_atomic(os.path.join(archive_dir, 'index.html'), [page])
+    return len(weeks)
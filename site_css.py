@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+SITE STYLESHEET BUILDER
+Build-time replacement for the Tailwind CDN script: scans the updater's templates for the
+utility classes they emit, generates only those rules (Tailwind v3 values), and publishes
+one content-hashed stylesheet the page links instead of compiling CSS in the browser
+"""
+
+import hashlib
+import itertools
+import os
+import re
+from typing import List, Dict, Tuple, Optional, Iterable
+
+ASSET_DIR = 'assets'
+
+# Tailwind v3 palette, for the color families the templates use
+PALETTE = {
+    'slate': {300: '#cbd5e1', 400: '#94a3b8', 500: '#64748b', 600: '#475569', 700: '#334155', 800: '#1e293b', 900: '#0f172a'},
+    'gray': {300: '#d1d5db', 400: '#9ca3af', 500: '#6b7280', 600: '#4b5563', 700: '#374151', 800: '#1f2937', 900: '#111827'},
+    'green': {300: '#86efac', 400: '#4ade80', 500: '#22c55e', 600: '#16a34a', 700: '#15803d', 800: '#166534', 900: '#14532d'},
+    'blue': {300: '#93c5fd', 400: '#60a5fa', 500: '#3b82f6', 600: '#2563eb', 700: '#1d4ed8', 800: '#1e40af', 900: '#1e3a8a'},
+    'purple': {300: '#d8b4fe', 400: '#c084fc', 500: '#a855f7', 600: '#9333ea', 700: '#7e22ce', 800: '#6b21a8', 900: '#581c87'},
+    'yellow': {300: '#fde047', 400: '#facc15', 500: '#eab308', 600: '#ca8a04', 700: '#a16207', 800: '#854d0e', 900: '#713f12'},
+    'red': {300: '#fca5a5', 400: '#f87171', 500: '#ef4444', 600: '#dc2626', 700: '#b91c1c', 800: '#991b1b', 900: '#7f1d1d'},
+    'orange': {300: '#fdba74', 400: '#fb923c', 500: '#f97316', 600: '#ea580c', 700: '#c2410c', 800: '#9a3412', 900: '#7c2d12'},
+}
+NAMED_COLORS = {'white': '#ffffff', 'black': '#000000'}
+
+FONT_SIZES = {
+    'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+    'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+    '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'),
+}
+FONT_WEIGHTS = {'normal': 400, 'medium': 500, 'semibold': 600, 'bold': 700}
+MAX_WIDTHS = {'md': '28rem', 'lg': '32rem', 'xl': '36rem', '2xl': '42rem', '4xl': '56rem', '6xl': '72rem', '7xl': '80rem'}
+RADII = {'': '0.25rem', 'md': '0.375rem', 'lg': '0.5rem', 'xl': '0.75rem', '2xl': '1rem', 'full': '9999px'}
+BREAKPOINTS = {'sm': '640px', 'md': '768px', 'lg': '1024px', 'xl': '1280px'}
+
+SIDES = {'': ('',), 'x': ('-left', '-right'), 'y': ('-top', '-bottom'),
+         't': ('-top',), 'r': ('-right',), 'b': ('-bottom',), 'l': ('-left',)}
+
+# The subset of Tailwind's preflight the templates rely on
+PREFLIGHT = (
+    "*,::before,::after{box-sizing:border-box;border:0 solid #e5e7eb}"
+    "html{line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4;font-family:ui-sans-serif,system-ui,sans-serif,"
+    "\"Apple Color Emoji\",\"Segoe UI Emoji\",\"Segoe UI Symbol\",\"Noto Color Emoji\"}"
+    "body{margin:0;line-height:inherit}"
+    "h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}"
+    "h1,h2,h3,h4,h5,h6,p{margin:0}"
+    "b,strong{font-weight:bolder}"
+    "table{text-indent:0;border-color:inherit;border-collapse:collapse}"
+    "button,input,select{font-family:inherit;font-size:100%;font-weight:inherit;line-height:inherit;color:inherit;margin:0;padding:0}"
+    "button,select{text-transform:none}"
+    "button{background-color:transparent;background-image:none;cursor:pointer}"
+    "input::placeholder{opacity:1;color:#9ca3af}"
+    "svg{display:block;vertical-align:middle}"
+    "[hidden]{display:none}"
+)
+
+CLASS_ATTRIBUTE = re.compile(r'class(?:Name)?\s*=\s*\\?["\']([^"\'\\]*)')
+STYLE_SELECTOR = re.compile(r'^\s*\.([A-Za-z][\w-]*)\s*\{', re.M)
+PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+
+def spacing(value: str) -> Optional[str]:
+    if value == 'auto':
+        return 'auto'
+    if value == 'px':
+        return '1px'
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return '0px' if number == 0 else f"{number * 0.25:g}rem"
+
+
+def color(name: str) -> Optional[str]:
+    """CSS color for a palette name like green-500 or green-500/30"""
+    name, _, opacity = name.partition('/')
+    if name in NAMED_COLORS:
+        hex_value = NAMED_COLORS[name]
+    else:
+        family, _, shade = name.rpartition('-')
+        if family not in PALETTE or not shade.isdigit() or int(shade) not in PALETTE[family]:
+            return None
+        hex_value = PALETTE[family][int(shade)]
+    if not opacity:
+        return hex_value
+    if not opacity.isdigit():
+        return None
+    r, g, b = (int(hex_value[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgb({r} {g} {b} / {int(opacity) / 100:g})"
+
+
+def transparent(css_color: str) -> str:
+    if css_color.startswith('#'):
+        r, g, b = (int(css_color[i:i + 2], 16) for i in (1, 3, 5))
+        return f"rgb({r} {g} {b} / 0)"
+    return css_color.rsplit('/', 1)[0] + '/ 0)'
+
+
+def sided(prop: str, side: str, value: str) -> str:
+    return ';'.join(f"{prop}{suffix}:{value}" for suffix in SIDES[side])
+
+
+def _static(table: Dict[str, str]):
+    return lambda name: table.get(name)
+
+
+def _spacing_rule(prop: str, pattern: str):
+    def rule(name: str) -> Optional[Tuple[int, str]]:
+        match = re.fullmatch(pattern, name)
+        if not match:
+            return None
+        side, value = match.group(1) or '', spacing(match.group(2))
+        return value and (list(SIDES).index(side), sided(prop, side, value))
+    return rule
+
+
+def _border_width(name: str) -> Optional[Tuple[int, str]]:
+    match = re.fullmatch(r'border(?:-([xytrbl]))?(?:-(\d+))?', name)
+    if not match:
+        return None
+    side = match.group(1) or ''
+    return list(SIDES).index(side), sided('border', side, f"{match.group(2) or 1}px").replace(':', '-width:')
+
+
+def _colored(prefix: str, prop: str):
+    def rule(name: str) -> Optional[str]:
+        value = name.startswith(prefix) and color(name[len(prefix):])
+        return value and f"{prop}:{value}"
+    return rule
+
+
+def _gradient_stop(name: str) -> Optional[Tuple[int, str]]:
+    stop, _, rest = name.partition('-')
+    value = stop in ('from', 'via', 'to') and color(rest)
+    if not value:
+        return None
+    if stop == 'from':
+        return 0, (f"--tw-gradient-from:{value};--tw-gradient-to:{transparent(value)};"
+                   "--tw-gradient-stops:var(--tw-gradient-from),var(--tw-gradient-to)")
+    if stop == 'via':
+        return 1, (f"--tw-gradient-to:{transparent(value)};"
+                   f"--tw-gradient-stops:var(--tw-gradient-from),{value},var(--tw-gradient-to)")
+    return 2, f"--tw-gradient-to:{value}"
+
+
+def _sized(pattern: str, prop: str):
+    def rule(name: str) -> Optional[str]:
+        match = re.fullmatch(pattern, name)
+        value = match and (spacing(match.group(1)) if match.group(1)[0].isdigit() else {'full': '100%'}.get(match.group(1)))
+        return value and f"{prop}:{value}"
+    return rule
+
+
+# Utility families in Tailwind's own emit order, which is what settles conflicts
+# between classes on the same element (e.g. p-4 before px-6)
+UTILITIES = [
+    _static({'sticky': 'position:sticky', 'relative': 'position:relative', 'absolute': 'position:absolute'}),
+    _static({'top-0': 'top:0px'}),
+    _static({'z-10': 'z-index:10', 'z-50': 'z-index:50'}),
+    _spacing_rule('margin', r'm([xytrbl])?-(auto|px|\d+(?:\.5)?)'),
+    _static({'block': 'display:block', 'inline-block': 'display:inline-block', 'flex': 'display:flex',
+             'inline-flex': 'display:inline-flex', 'table': 'display:table', 'grid': 'display:grid', 'hidden': 'display:none'}),
+    _sized(r'h-(\d+(?:\.5)?|full)', 'height'),
+    _static({'min-h-screen': 'min-height:100vh'}),
+    _sized(r'w-(\d+(?:\.5)?|full)', 'width'),
+    lambda name: name.startswith('max-w-') and name[6:] in MAX_WIDTHS and f"max-width:{MAX_WIDTHS[name[6:]]}",
+    _static({'flex-1': 'flex:1 1 0%'}),
+    lambda name: re.fullmatch(r'grid-cols-(\d+)', name) and f"grid-template-columns:repeat({name[10:]},minmax(0,1fr))",
+    _static({'flex-row': 'flex-direction:row', 'flex-col': 'flex-direction:column'}),
+    _static({'items-start': 'align-items:flex-start', 'items-center': 'align-items:center', 'items-end': 'align-items:flex-end'}),
+    _static({'justify-start': 'justify-content:flex-start', 'justify-center': 'justify-content:center',
+             'justify-end': 'justify-content:flex-end', 'justify-between': 'justify-content:space-between'}),
+    lambda name: re.fullmatch(r'gap-(\d+(?:\.5)?)', name) and f"gap:{spacing(name[4:])}",
+    None,  # space-x / space-y: child selectors, handled in utility_rule
+    lambda name: (name == 'rounded' or name.startswith('rounded-')) and name[8:] in RADII and f"border-radius:{RADII[name[8:]]}",
+    _border_width,
+    _colored('border-', 'border-color'),
+    _colored('bg-', 'background-color'),
+    _static({'bg-gradient-to-r': 'background-image:linear-gradient(to right,var(--tw-gradient-stops))',
+             'bg-gradient-to-br': 'background-image:linear-gradient(to bottom right,var(--tw-gradient-stops))'}),
+    _gradient_stop,
+    _spacing_rule('padding', r'p([xytrbl])?-(px|\d+(?:\.5)?)'),
+    _static({'text-left': 'text-align:left', 'text-center': 'text-align:center', 'text-right': 'text-align:right'}),
+    lambda name: name.startswith('text-') and name[5:] in FONT_SIZES and "font-size:{};line-height:{}".format(*FONT_SIZES[name[5:]]),
+    lambda name: name.startswith('font-') and name[5:] in FONT_WEIGHTS and f"font-weight:{FONT_WEIGHTS[name[5:]]}",
+    _colored('text-', 'color'),
+    _static({'transition-all': 'transition-property:all;transition-timing-function:cubic-bezier(0.4,0,0.2,1);transition-duration:150ms'}),
+]
+SPACE_INDEX = UTILITIES.index(None)
+
+
+def escape(class_name: str) -> str:
+    return re.sub(r'([:/.])', r'\\\1', class_name)
+
+
+def utility_rule(name: str) -> Optional[Tuple[Tuple[int, int], str, str]]:
+    """(sort key, selector suffix, declarations) for a base utility, or None if it isn't one"""
+    match = re.fullmatch(r'space-([xy])-(\d+(?:\.5)?)', name)
+    if match:
+        side = 'left' if match.group(1) == 'x' else 'top'
+        return (SPACE_INDEX, 0), ' > :not([hidden]) ~ :not([hidden])', f"margin-{side}:{spacing(match.group(2))}"
+    for index, rule in enumerate(UTILITIES):
+        result = rule and rule(name)
+        if result:
+            order, declarations = result if isinstance(result, tuple) else (0, result)
+            return (index, order), '', declarations
+    return None
+
+
+def template_classes(sources: Iterable[str], placeholders: Dict[str, Tuple[str, ...]]) -> set:
+    """Class names in the templates' class attributes, with {slot} placeholders expanded"""
+    classes = set()
+    for source in sources:
+        for match in CLASS_ATTRIBUTE.finditer(source):
+            for token in match.group(1).split():
+                slots = PLACEHOLDER.findall(token)
+                if not slots:
+                    classes.add(token)
+                    continue
+                if not all(slot in placeholders for slot in slots):
+                    continue
+                for values in itertools.product(*(placeholders[slot] for slot in slots)):
+                    expanded = token
+                    for slot, value in zip(slots, values):
+                        expanded = expanded.replace('{' + slot + '}', value, 1)
+                    classes.add(expanded)
+    return classes
+
+
+def build_stylesheet(classes: Iterable[str]) -> Tuple[str, List[str]]:
+    """Minified CSS for the classes, plus the ones no utility matched"""
+    base, hover, responsive, unmatched = [], [], {point: [] for point in BREAKPOINTS}, []
+    for name in sorted(set(classes)):
+        variant, _, utility = name.rpartition(':')
+        rule = utility_rule(utility)
+        if rule is None or variant not in ('', 'hover', *BREAKPOINTS):
+            unmatched.append(name)
+            continue
+        key, suffix, declarations = rule
+        pseudo = ':hover' if variant == 'hover' else ''
+        entry = (key, name, f".{escape(name)}{pseudo}{suffix}{{{declarations}}}")
+        if variant == 'hover':
+            hover.append(entry)
+        elif variant:
+            responsive[variant].append(entry)
+        else:
+            base.append(entry)
+
+    css = [PREFLIGHT] + [rule for _, _, rule in sorted(base) + sorted(hover)]
+    for point, entries in responsive.items():
+        if entries:
+            css.append(f"@media (min-width:{BREAKPOINTS[point]}){{{''.join(rule for _, _, rule in sorted(entries))}}}")
+    return '\n'.join(css) + '\n', unmatched
+
+
+def publish_stylesheet(prefix: str, template_files: List[str], placeholders: Dict[str, Tuple[str, ...]],
+                       asset_dir: str = ASSET_DIR) -> str:
+    """Write the stylesheet for these templates as <prefix>.<hash>.css and return its site-root URL
+
+    The hash only moves when the templates emit a different set of classes, so browsers
+    can cache the file for good. Classes neither generated here nor defined in a template's
+    own <style> block are reported, since they would render unstyled.
+    """
+    sources = []
+    for path in template_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            sources.append(f.read())
+
+    css, unmatched = build_stylesheet(template_classes(sources, placeholders))
+    custom = {name for source in sources for name in STYLE_SELECTOR.findall(source)}
+    missing = [name for name in unmatched if name not in custom]
+    if missing:
+        print(f"No stylesheet rule for classes: {', '.join(missing)}")
+
+    digest = hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]
+    path = os.path.join(asset_dir, f"{prefix}.{digest}.css")
+    if not os.path.exists(path):
+        os.makedirs(asset_dir, exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(css)
+        os.replace(temp_path, path)
+    return '/' + path.replace(os.sep, '/')
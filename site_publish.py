@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+CHANGE-AWARE SITE PUBLISH
+Hashes the rendered artifacts against the manifest of the last publish and stages only the
+files that changed, so a rerun that produced the same picks commits and pushes nothing
+Run timestamps (data-build-stamp elements, generated_at/last_updated keys) are left out of the
+hashes; a page whose picks are unchanged is not a new page
+Without git, publish_local snapshots the site into versioned directories behind an atomically
+swapped `current` symlink, hard-linking unchanged files, so rollback is one rename
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+from datetime import datetime
+from typing import List, Dict, Tuple
+
+MANIFEST_PATH = 'data/publish-manifest.json'
+
+# Everything the updaters render for the site; .gz/.br siblings travel with their source
+ARTIFACTS = [
+    'index.html',
+    'archive/index.html',
+    'archive/*/week-*.html',
+    'assets/*.css',
+    'data/weekly-picks.json',
+    'data/picks/*.json',
+    'data/search-index.json'
+]
+SIBLINGS = ('.gz', '.br')
+
+BUILD_STAMP = re.compile(r'(<[^>]*\bdata-build-stamp\b[^>]*>)[^<]*')
+VOLATILE_KEYS = {'generated_at', 'last_updated'}
+
+
+def artifact_paths(patterns: List[str] = ARTIFACTS) -> List[str]:
+    """Rendered files present on disk, as sorted '/'-separated paths"""
+    paths = set()
+    for pattern in patterns:
+        paths.update(path.replace(os.sep, '/') for path in glob.glob(pattern) if os.path.isfile(path))
+    return sorted(paths)
+
+
+def _strip_volatile(value):
+    if isinstance(value, dict):
+        return {key: _strip_volatile(item) for key, item in value.items() if key not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+def stable_digest(path: str) -> str:
+    """sha256 of a file's content with its run timestamps blanked out"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if path.endswith('.html'):
+        data = BUILD_STAMP.sub(r'\1', data.decode('utf-8')).encode('utf-8')
+    elif path.endswith('.json'):
+        payload = _strip_volatile(json.loads(data))
+        data = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_manifest(patterns: List[str] = ARTIFACTS) -> Dict[str, Dict]:
+    """{path: {'sha256', 'siblings'}} for every rendered file"""
+    return {
+        path: {
+            'sha256': stable_digest(path),
+            'siblings': [suffix for suffix in SIBLINGS if os.path.exists(path + suffix)]
+        }
+        for path in artifact_paths(patterns)
+    }
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> Dict[str, Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: Dict[str, Dict], path: str = MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(temp_path, path)
+
+
+def diff_manifests(previous: Dict[str, Dict], current: Dict[str, Dict]) -> Tuple[List[str], List[str]]:
+    """(files to stage, files to unstage): changed artifacts with their siblings, and whatever is gone"""
+    stage, remove = [], []
+    for path, entry in current.items():
+        before = previous.get(path)
+        if before == entry:
+            continue
+        if before is None or before['sha256'] != entry['sha256']:
+            stage.append(path)
+        stage.extend(path + suffix for suffix in entry['siblings'])
+        if before:
+            remove.extend(path + suffix for suffix in before['siblings'] if suffix not in entry['siblings'])
+    for path, entry in previous.items():
+        if path not in current:
+            remove.extend([path] + [path + suffix for suffix in entry['siblings']])
+    return stage, remove
+
+
+def _git(*args) -> subprocess.CompletedProcess:
+    return subprocess.run(['git', *args], check=True, capture_output=True, text=True)
+
+
+def publish_to_git(message: str, remote: str = 'origin', branch: str = 'main', manifest_path: str = MANIFEST_PATH) -> Dict:
+    """Commit and push the artifacts that changed since the last publish, and nothing else
+
+    Returns {'staged', 'removed', 'committed', 'pushed'}; when nothing changed, git isn't
+    touched at all. If a git step fails the previous manifest is put back, so the next run
+    retries the publish, and the CalledProcessError propagates.
+    """
+    previous = load_manifest(manifest_path)
+    manifest = build_manifest()
+    stage, remove = diff_manifests(previous, manifest)
+    result = {'staged': stage, 'removed': remove, 'committed': False, 'pushed': False}
+    if not stage and not remove:
+        return result
+
+    save_manifest(manifest, manifest_path)
+    try:
+        _git('add', '--', manifest_path, *stage)
+        if remove:
+            _git('rm', '--cached', '--quiet', '--ignore-unmatch', '--', *remove)
+        # Paths already committed by a run whose push failed have nothing left to commit
+        staged = _git('diff', '--cached', '--name-only', '--', manifest_path, *stage, *remove).stdout.split()
+        if staged:
+            _git('commit', '--quiet', '-m', message, '--', *staged)
+            result['committed'] = True
+        _git('push', '--quiet', remote, branch)
+        result['pushed'] = True
+    except (subprocess.CalledProcessError, OSError):
+        save_manifest(previous, manifest_path)
+        raise
+    return result
+
+
+# Local target: LOCAL_ROOT/versions/<version>/ holds complete builds, LOCAL_ROOT/current links to the live one
+LOCAL_ROOT = 'build/site'
+SITE_FILES = ARTIFACTS + ['picks.html']
+VERSION_MANIFEST = 'manifest.json'
+KEEP_VERSIONS = 20
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's exact bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def site_manifest(patterns: List[str] = SITE_FILES) -> Dict[str, Dict]:
+    """{path: {'sha256', 'stable'}} for every file the site serves, siblings included
+
+    sha256 is the exact bytes; stable is the source's stable_digest, shared by its .gz/.br
+    siblings so a compressed copy always travels with the file it was made from.
+    """
+    manifest = {}
+    for path in artifact_paths(patterns):
+        stable = stable_digest(path)
+        manifest[path] = {'sha256': file_digest(path), 'stable': stable}
+        for suffix in SIBLINGS:
+            if os.path.exists(path + suffix):
+                manifest[path + suffix] = {'sha256': file_digest(path + suffix), 'stable': stable}
+    return manifest
+
+
+def _stable_view(manifest: Dict) -> Dict[str, str]:
+    # Versions published before entries carried 'stable' compare as changed
+    return {path: entry.get('stable') if isinstance(entry, dict) else None for path, entry in manifest.items()}
+
+
+def list_versions(root: str = LOCAL_ROOT) -> List[str]:
+    """Published versions, oldest first"""
+    versions_dir = os.path.join(root, 'versions')
+    if not os.path.isdir(versions_dir):
+        return []
+    return sorted(name for name in os.listdir(versions_dir)
+                  if not name.endswith('.tmp') and os.path.isfile(os.path.join(versions_dir, name, VERSION_MANIFEST)))
+
+
+def current_version(root: str = LOCAL_ROOT) -> str:
+    """Version the current link points at, or '' before the first publish"""
+    link = os.path.join(root, 'current')
+    return os.path.basename(os.readlink(link)) if os.path.islink(link) else ''
+
+
+def _version_manifest(root: str, version: str) -> Dict[str, Dict]:
+    if not version:
+        return {}
+    with open(os.path.join(root, 'versions', version, VERSION_MANIFEST), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def switch_version(version: str, root: str = LOCAL_ROOT):
+    """Point root/current at a version with one rename, so readers see the old build or the new, never a mix"""
+    if version not in list_versions(root):
+        raise ValueError(f"No published version {version!r} in {root}")
+    link = os.path.join(root, 'current')
+    temp_link = f"{link}.{os.getpid()}.tmp"
+    os.symlink(os.path.join('versions', version), temp_link)
+    os.replace(temp_link, link)
+
+
+def publish_local(root: str = LOCAL_ROOT, keep: int = KEEP_VERSIONS) -> Dict:
+    """Snapshot the rendered site into a new version directory and make it current
+
+    Changes are judged like the git target's, with run timestamps left out: when no file
+    differs from the current version but for its build stamp, no version is made. Files
+    that match are hard-linked from the current version (copied when the filesystem can't
+    link), so they keep its bytes; only changed files are written. Returns {'version',
+    'copied', 'linked', 'unchanged'}.
+    """
+    previous_version = current_version(root)
+    previous = _version_manifest(root, previous_version)
+    manifest = site_manifest()
+    previous_stable = _stable_view(previous)
+    if _stable_view(manifest) == previous_stable:
+        return {'version': previous_version, 'copied': [], 'linked': [], 'unchanged': True}
+
+    digest = hashlib.sha256(json.dumps(manifest, sort_keys=True).encode('utf-8')).hexdigest()[:8]
+    version = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{digest}"
+    version_dir = os.path.join(root, 'versions', version)
+    build_dir = f"{version_dir}.{os.getpid()}.tmp"
+    copied, linked = [], []
+    try:
+        for path, entry in manifest.items():
+            target = os.path.join(build_dir, path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if previous_stable.get(path) == entry['stable']:
+                try:
+                    os.link(os.path.join(root, 'versions', previous_version, path), target)
+                    manifest[path] = previous[path]
+                    linked.append(path)
+                    continue
+                except OSError:
+                    pass
+            shutil.copy2(path, target)
+            copied.append(path)
+        with open(os.path.join(build_dir, VERSION_MANIFEST), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.rename(build_dir, version_dir)
+    except BaseException:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        raise
+
+    switch_version(version, root)
+    prune_versions(root, keep)
+    return {'version': version, 'copied': copied, 'linked': linked, 'unchanged': False}
+
+
+def rollback(version: str = '', root: str = LOCAL_ROOT) -> str:
+    """Make an earlier version current again (the one before current by default); returns it"""
+    versions = list_versions(root)
+    if not version:
+        current = current_version(root)
+        older = [name for name in versions if name < current]
+        if not older:
+            raise ValueError(f"Nothing older than {current or 'the first publish'} to roll back to")
+        version = older[-1]
+    switch_version(version, root)
+    return version
+
+
+def prune_versions(root: str = LOCAL_ROOT, keep: int = KEEP_VERSIONS) -> List[str]:
+    """Delete all but the newest `keep` versions, never the current one"""
+    current = current_version(root)
+    stale = [name for name in list_versions(root)[:-keep] if name != current] if keep > 0 else []
+    for name in stale:
+        shutil.rmtree(os.path.join(root, 'versions', name), ignore_errors=True)
+    return stale
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local site builds: publish, list and roll back')
+    parser.add_argument('command', choices=['publish', 'list', 'rollback'])
+    parser.add_argument('version', nargs='?', default='', help='version to roll back to (default: the one before current)')
+    parser.add_argument('--root', default=os.getenv('PUBLISH_DIR', LOCAL_ROOT))
+    args = parser.parse_args()
+
+    if args.command == 'publish':
+        result = publish_local(args.root)
+        print(f"{result['version']}: {len(result['copied'])} files written, {len(result['linked'])} linked"
+              + (" (unchanged, nothing published)" if result['unchanged'] else ""))
+    elif args.command == 'list':
+        current = current_version(args.root)
+        for name in list_versions(args.root):
+            print(f"{'*' if name == current else ' '} {name}")
+    else:
+        print(f"current -> {rollback(args.version, args.root)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+TOTALS ENGINE
+Models each team's points as a touchdown/field goal scoring distribution
+and prices the posted total for a whole slate at once
+"""
+
+import math
+from functools import lru_cache
+from typing import List, Dict, Tuple
+
+MAX_POINTS = 84
+
+# Share of a team's expected points that comes from field goals
+FIELD_GOAL_SHARE = 0.22
+
+# Offensive possessions per team per game
+DRIVES = {'NFL': 11, 'CFB': 13}
+
+# Total home field edge in points, split evenly between the two offenses
+HOME_FIELD_POINTS = {'NFL': 2.0, 'CFB': 3.0}
+
+# How far P(over) must move off a coin flip before we call a lean
+LEAN_THRESHOLD = 0.05
+
+
+@lru_cache(maxsize=4096)
+def points_pmf(expected_points: float, drives: int = 11) -> Tuple[float, ...]:
+    """PMF of a team's points: each drive ends in a touchdown (7), field goal (3) or nothing"""
+    expected_points = min(max(expected_points, 1.0), 6.5 * drives)
+    p_td = (1 - FIELD_GOAL_SHARE) * expected_points / (7 * drives)
+    p_fg = FIELD_GOAL_SHARE * expected_points / (3 * drives)
+    p_none = max(1 - p_td - p_fg, 0.0)
+
+    pmf = [0.0] * (MAX_POINTS + 1)
+    for td in range(drives + 1):
+        for fg in range(drives - td + 1):
+            points = 7 * td + 3 * fg
+            if points > MAX_POINTS:
+                break
+            ways = math.comb(drives, td) * math.comb(drives - td, fg)
+            pmf[points] += ways * p_td ** td * p_fg ** fg * p_none ** (drives - td - fg)
+
+    norm = sum(pmf)
+    return tuple(p / norm for p in pmf)
+
+
+@lru_cache(maxsize=4096)
+def points_survival(expected_points: float, drives: int = 11) -> Tuple[float, ...]:
+    """P(points > x) for x in 0..MAX_POINTS"""
+    pmf = points_pmf(expected_points, drives)
+    survival = [0.0] * (MAX_POINTS + 1)
+    remaining = 1.0
+    for x in range(MAX_POINTS + 1):
+        remaining -= pmf[x]
+        survival[x] = max(remaining, 0.0)
+    return tuple(survival)
+
+
+def expected_points(offense_ppg: float, opponent_allowed_ppg: float) -> float:
+    """Blend a team's scoring with what the opponent allows"""
+    return (offense_ppg + opponent_allowed_ppg) / 2
+
+
+def price_total(away_mean: float, home_mean: float, total: float, drives: int = 11) -> Dict:
+    """Over/under/push probabilities for one game from the two team distributions"""
+    # Cache distributions on a 0.1-point grid so a slate shares work
+    away_pmf = points_pmf(round(away_mean, 1), drives)
+    home_survival = points_survival(round(home_mean, 1), drives)
+    home_pmf = points_pmf(round(home_mean, 1), drives)
+
+    p_over = 0.0
+    p_push = 0.0
+    whole_total = float(total).is_integer()
+    for away_points, p_away in enumerate(away_pmf):
+        # Home needs more than (total - away) for the over
+        needed = math.floor(total - away_points)
+        if needed < 0:
+            p_over += p_away
+        elif needed <= MAX_POINTS:
+            p_over += p_away * home_survival[needed]
+        if whole_total:
+            exact = int(total) - away_points
+            if 0 <= exact <= MAX_POINTS:
+                p_push += p_away * home_pmf[exact]
+
+    return {'p_over': p_over, 'p_under': 1 - p_over - p_push, 'p_push': p_push}
+
+
+def pmf_mode(pmf: Tuple[float, ...]) -> int:
+    """Most likely score"""
+    return max(range(len(pmf)), key=pmf.__getitem__)
+
+
+def project_slate_totals(matchups: List[Dict]) -> List[Dict]:
+    """Project every game on a slate in one call
+
+    Each matchup needs away_ppg, away_allowed, home_ppg, home_allowed, total and league.
+    """
+    projections = []
+    for matchup in matchups:
+        league = matchup.get('league', 'NFL')
+        drives = DRIVES.get(league, 11)
+        hfa = HOME_FIELD_POINTS.get(league, 2.0) / 2
+        away_mean = expected_points(matchup['away_ppg'], matchup['home_allowed']) - hfa
+        home_mean = expected_points(matchup['home_ppg'], matchup['away_allowed']) + hfa
+
+        prices = price_total(away_mean, home_mean, matchup['total'], drives)
+        away_score = pmf_mode(points_pmf(round(away_mean, 1), drives))
+        home_score = pmf_mode(points_pmf(round(home_mean, 1), drives))
+
+        if prices['p_over'] > 0.5 + LEAN_THRESHOLD:
+            lean = 'OVER'
+        elif prices['p_under'] > 0.5 + LEAN_THRESHOLD:
+            lean = 'UNDER'
+        else:
+            lean = 'CLOSE'
+
+        projections.append({
+            'away_score': away_score,
+            'home_score': home_score,
+            'away_expected': round(away_mean, 1),
+            'home_expected': round(home_mean, 1),
+            'total_projected': round(away_mean + home_mean, 1),
+            'p_over': round(prices['p_over'], 4),
+            'p_under': round(prices['p_under'], 4),
+            'p_push': round(prices['p_push'], 4),
+            'total_lean': lean
+        })
+    return projections